@@ -1,28 +1,393 @@
+import gzip
+import heapq
+import json
+import math
+import os
+import random
+import struct
+from time import monotonic
+
+# Compact state codes used by the transition log
+STATE_CODES = {"ready": 0, "running": 1, "completed": 2, "blocked": 3}
+STATE_NAMES = {code: state for state, code in STATE_CODES.items()}
+
+CHECKPOINT_VERSION = 2
+CLOCK_CHECK_EVENTS = 256  # Scheduling events between wall clock and progress checks
+DEFAULT_TICKETS = 100  # Lottery/stride tickets at priority 0 without an explicit weight
+STRIDE1 = 1 << 20  # Stride scheduling numerator; a process's stride is STRIDE1 // tickets
+MAX_DEFAULT_HORIZON = 10 ** 6  # Longest hyperperiod simulated without an explicit horizon
+MAX_ANALYSIS_STEPS = 100000  # Iteration budget of each schedulability test
+
+
+class SimulationCancelled(Exception):
+    """Raised from a progress callback to abandon a running schedule"""
+
+
+class StateLog:
+    """Bounded ring buffer of state transitions shared by all processes.
+    Each transition is packed as a (time, pid, state code) record together
+    with the busy time before it, the number of processes running after it
+    and its write sequence number; once the buffer is full the oldest
+    records are overwritten."""
+
+    RECORD = struct.Struct("<qqBqIq")
+
+    def __init__(self, capacity=65536):
+        if capacity <= 0:
+            raise ValueError("State log capacity must be positive")
+        self.capacity = capacity
+        self.buffer = bytearray(capacity * self.RECORD.size)
+        self.written = 0  # Records ever written; the next record's sequence number
+        self.clear()
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return self._iter_from(0)
+
+    def record(self, time, pid, state):
+        """Append a transition, overwriting the oldest one when full"""
+        running = state == "running"
+        if time < self.time:
+            # I/O completions are logged at their own time after transitions
+            # that happened later; they only move a process out of blocked
+            if running != (pid in self.running):
+                raise ValueError("Late transitions cannot start or stop a running process")
+        else:
+            if self.running:
+                self.busy += time - self.time
+            self.time = time
+            if running:
+                self.running.add(pid)
+            else:
+                self.running.discard(pid)
+        if self.origin is None:
+            self.origin = time
+
+        slot = (self.start + self.count) % self.capacity
+        if self.count == self.capacity:
+            self.evicted = self._fields(0)
+            self.start = (self.start + 1) % self.capacity
+        else:
+            self.count += 1
+        self.RECORD.pack_into(self.buffer, slot * self.RECORD.size, time, pid, STATE_CODES[state],
+                              self.busy, len(self.running), self.written)
+        self.written += 1
+        if time >= self.time:
+            return
+
+        # Move a late record back to keep the log time ordered, then take its
+        # busy time and running count from the record now before it
+        size = self.RECORD.size
+        index = self.count - 1
+        while index > 0 and self._read(index - 1)[0] > time:
+            later = ((self.start + index - 1) % self.capacity) * size
+            current = ((self.start + index) % self.capacity) * size
+            self.buffer[later:later + size], self.buffer[current:current + size] = (
+                self.buffer[current:current + size], self.buffer[later:later + size])
+            index -= 1
+        before = self._fields(index - 1) if index > 0 else self.evicted
+        busy, count = (self._advance(before, time), before[4]) if before else (0, len(self.running))
+        slot = (self.start + index) % self.capacity
+        self.RECORD.pack_into(self.buffer, slot * self.RECORD.size, time, pid, STATE_CODES[state],
+                              busy, count, self.written - 1)
+
+    def clear(self):
+        self.start = 0
+        self.count = 0
+        self.cleared = self.written  # Sequence number of the first record after the clear
+        self.origin = None  # Time of the first record after the clear
+        self.evicted = None  # Fields of the newest overwritten record
+        self.running = set()  # Pids running after the newest record
+        self.time = 0  # Time of the newest in-order record
+        self.busy = 0  # Busy time before self.time
+
+    def rewind(self, written, time, running, since=None):
+        """Drop the records written after the log held its first `written`
+        records, e.g. when a run resumes from a snapshot taken then. time is
+        the snapshot time, running the pids on the CPU at that point and
+        since the earliest time a dropped record can have (late I/O wakeups
+        may precede the snapshot). With written None, or when the log no
+        longer holds that history, it restarts empty at time."""
+        if (written is None or written < self.cleared or written > self.written or
+                (self.evicted is not None and self.evicted[5] >= written)):
+            self.clear()
+            self.time = time
+        else:
+            size = self.RECORD.size
+            index = kept = self._lower_bound(time if since is None else min(since, time))
+            for index in range(index, self.count):
+                if self._fields(index)[5] < written:
+                    source = ((self.start + index) % self.capacity) * size
+                    target = ((self.start + kept) % self.capacity) * size
+                    self.buffer[target:target + size] = self.buffer[source:source + size]
+                    kept += 1
+            self.count = kept
+            newest = self._fields(kept - 1) if kept else self.evicted
+            self.time, self.busy = (newest[0], newest[3]) if newest else (time, 0)
+            self.written = written
+        self.running = set(running)
+
+    def _fields(self, index):
+        """Unpack all fields of the index-th oldest record"""
+        slot = (self.start + index) % self.capacity
+        return self.RECORD.unpack_from(self.buffer, slot * self.RECORD.size)
+
+    def _read(self, index):
+        """Unpack the index-th oldest record as (time, pid, state)"""
+        time, pid, code = self._fields(index)[:3]
+        return time, pid, STATE_NAMES[code]
+
+    def _iter_from(self, index):
+        for i in range(index, self.count):
+            yield self._read(i)
+
+    def _lower_bound(self, time, after=False):
+        """Index of the first record at or after time, or strictly after it
+        with after set (records are time ordered)"""
+        low, high = 0, self.count
+        while low < high:
+            mid = (low + high) // 2
+            mid_time = self._read(mid)[0]
+            if mid_time < time or (after and mid_time == time):
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def query(self, start=None, end=None):
+        """Yield (time, pid, state) records with start <= time < end"""
+        index = 0 if start is None else self._lower_bound(start)
+        for record in self._iter_from(index):
+            if end is not None and record[0] >= end:
+                break
+            yield record
+
+    @staticmethod
+    def _advance(fields, time):
+        """Busy time before time, from the fields of a record no later than it"""
+        record_time, _, _, busy, running, _ = fields
+        return busy + max(time - record_time, 0) if running else busy
+
+    def _busy_at(self, time, index):
+        """Busy time before time, given the index of the last record at or
+        before it (-1 if none is retained)"""
+        if index >= 0:
+            return self._advance(self._fields(index), time)
+        if self.evicted is not None:
+            if time >= self.evicted[0]:
+                return self._advance(self.evicted, time)
+            if time > self.origin:
+                raise ValueError(f"Time {time} is older than the state log's retained history")
+            return 0
+        if self.count == 0:
+            return self._advance((self.time, 0, 0, self.busy, len(self.running), 0), time)
+        return 0
+
+    def busy_time(self, start, end):
+        """Time within [start, end) during which some process was running.
+        Each record carries the busy time before it, so this costs two
+        binary searches however long the log is."""
+        return (self._busy_at(end, self._lower_bound(end, after=True) - 1) -
+                self._busy_at(start, self._lower_bound(start, after=True) - 1))
+
+
+class IndexedHeap:
+    """Binary min-heap of items keyed by id. A position index makes
+    membership tests, key updates (decrease-key) and removal O(log n)."""
+
+    def __init__(self):
+        self.heap = []  # [key, item] pairs
+        self.index = {}  # item -> position in heap
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, item):
+        return item in self.index
+
+    def push(self, item, key):
+        """Insert item, or update its key if already present"""
+        if item in self.index:
+            self.update(item, key)
+            return
+        self.heap.append([key, item])
+        self.index[item] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+
+    def peek(self):
+        key, item = self.heap[0]
+        return key, item
+
+    def pop(self):
+        """Remove and return the (key, item) pair with the smallest key"""
+        key, item = self.heap[0]
+        self.remove(item)
+        return key, item
+
+    def update(self, item, key):
+        position = self.index[item]
+        old_key = self.heap[position][0]
+        self.heap[position][0] = key
+        if key < old_key:
+            self._sift_up(position)
+        else:
+            self._sift_down(position)
+
+    def remove(self, item):
+        position = self.index.pop(item)
+        last = self.heap.pop()
+        if position < len(self.heap):
+            self.heap[position] = last
+            self.index[last[1]] = position
+            self._sift_up(position)
+            self._sift_down(self.index[last[1]])
+
+    def _swap(self, i, j):
+        self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+        self.index[self.heap[i][1]] = i
+        self.index[self.heap[j][1]] = j
+
+    def _sift_up(self, position):
+        while position > 0:
+            parent = (position - 1) // 2
+            if self.heap[position][0] >= self.heap[parent][0]:
+                break
+            self._swap(position, parent)
+            position = parent
+
+    def _sift_down(self, position):
+        size = len(self.heap)
+        while True:
+            smallest = position
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < size and self.heap[child][0] < self.heap[smallest][0]:
+                    smallest = child
+            if smallest == position:
+                break
+            self._swap(position, smallest)
+            position = smallest
+
+
+class FenwickTree:
+    """Binary indexed tree over non-negative integer weights with O(log n)
+    point updates and weighted selection"""
+
+    def __init__(self, size):
+        self.size = size
+        self.tree = [0] * (size + 1)
+        self.total = 0
+        self.top = 1  # Highest power of two <= size, for the descent in find
+        while self.top * 2 <= size:
+            self.top *= 2
+
+    def add(self, index, delta):
+        self.total += delta
+        index += 1
+        while index <= self.size:
+            self.tree[index] += delta
+            index += index & -index
+
+    def find(self, target):
+        """Index of the weight covering target, for 0 <= target < total"""
+        position = 0
+        step = self.top
+        while step:
+            following = position + step
+            if following <= self.size and self.tree[following] <= target:
+                position = following
+                target -= self.tree[following]
+            step //= 2
+        return position
+
+
 class Process:
-    def __init__(self, pid, arrival_time, burst_time, priority=0):
+    # Fields that change while a schedule runs; captured by run snapshots
+    RUN_FIELDS = ("remaining_time", "waiting_time", "turnaround_time",
+                  "completion_time", "response_time", "state", "start_time",
+                  "burst_index", "burst_remaining", "io_time", "ready_since",
+                  "pass_value", "share_mark", "ideal_time", "jobs")
+
+    def __init__(self, pid, arrival_time, burst_time, priority=0, bursts=None, io_device=None,
+                 weight=None, deadline=None, period=None):
         self.pid = pid
         self.arrival_time = arrival_time
-        self.burst_time = burst_time
+        self.burst_time = burst_time  # Total CPU time over all CPU bursts
         self.remaining_time = burst_time
         self.priority = priority
         self.waiting_time = 0
         self.turnaround_time = 0
         self.completion_time = 0
         self.response_time = -1
-        self.state = "ready"  # ready, running, completed
-        self.state_history = []  # Track state changes
+        self.state = "ready"  # ready, running, blocked, completed
+        self.log = None  # Optional shared StateLog
         self.start_time = -1  # Track when process first starts
-        
-    def update_state(self, new_state, time):
-        """Record state transition with timestamp"""
-        if self.state != new_state:
-            self.state = new_state
-            self.state_history.append((time, new_state))
-            
+        # Alternating CPU/I/O burst sequence: [cpu, io, cpu, ..., cpu]
+        self.bursts = list(bursts) if bursts else [burst_time]
+        self.io_device = io_device  # I/O requests queue on this device if set
+        self.burst_index = 0  # Index of the current CPU burst in bursts
+        self.burst_remaining = self.bursts[0]
+        self.io_time = 0  # Time spent blocked, including device queueing
+        self.ready_since = -1  # When the process last entered the ready set
+        self.weight = weight  # Explicit lottery/stride tickets
+        self.pass_value = 0  # Stride scheduling pass
+        self.share_mark = 0  # Share clock when the process last became runnable
+        self.ideal_time = 0  # CPU time owed under exact proportional share
+        # Real-time parameters: a job of burst_time is released every period
+        # (once if None) and is due deadline after release (period if None)
+        self.deadline = deadline
+        self.period = period
+        self.jobs = 1  # Jobs released in the last run; more for periodic processes
+
+    def relative_deadline(self):
+        if self.deadline is not None:
+            return self.deadline
+        return self.period if self.period is not None else float("inf")
+
+    def tickets(self):
+        """Proportional share: the explicit weight, else derived from priority"""
+        if self.weight:
+            return self.weight
+        return max(DEFAULT_TICKETS // (self.priority + 1), 1)
+
+    def reset(self):
+        """Restore the initial run state before a new scheduling run"""
+        self.remaining_time = self.burst_time
+        self.waiting_time = 0
+        self.turnaround_time = 0
+        self.completion_time = 0
+        self.response_time = -1
+        self.state = "ready"
+        self.start_time = -1
+        self.burst_index = 0
+        self.burst_remaining = self.bursts[0]
+        self.io_time = 0
+        self.ready_since = -1
+        self.pass_value = 0
+        self.share_mark = 0
+        self.ideal_time = 0
+        self.jobs = 1
+
+    def save_state(self):
+        return [getattr(self, field) for field in self.RUN_FIELDS]
+
+    def restore_state(self, values):
+        for field, value in zip(self.RUN_FIELDS, values):
+            setattr(self, field, value)
+
+    def definition(self):
+        """Input parameters that determine how the process is scheduled, in
+        constructor order"""
+        return (self.pid, self.arrival_time, self.burst_time, self.priority,
+                tuple(self.bursts), self.io_device, self.weight, self.deadline, self.period)
+
     def update_state(self, new_state, current_time):
-        """Update process state and track metrics"""
+        """Update process state, track metrics and record the transition"""
         if self.state != new_state:
             self.state = new_state
+            if self.log is not None:
+                self.log.record(current_time, self.pid, new_state)
             if new_state == "running":
                 if self.start_time == -1:
                     self.start_time = current_time
@@ -30,17 +395,62 @@ class Process:
             elif new_state == "completed":
                 self.completion_time = current_time
                 self.turnaround_time = self.completion_time - self.arrival_time
-                self.waiting_time = self.turnaround_time - self.burst_time
+                self.waiting_time = self.turnaround_time - self.burst_time - self.io_time
 
 class CPUScheduler:
     """CPU Scheduler implementation with various scheduling algorithms.
     Supports 3-10 processes with a fixed time quantum of 3."""
+
+    # Algorithm key -> (method name, keyword arguments), used by run()
+    ALGORITHMS = {
+        "rr": ("round_robin", {}),
+        "sjf": ("sjf_nonpreemptive", {}),
+        "sjf_p": ("sjf_preemptive", {}),
+        "priority": ("priority_scheduling", {"preemptive": False}),
+        "priority_p": ("priority_scheduling", {"preemptive": True}),
+        "lottery": ("lottery", {}),
+        "stride": ("stride", {}),
+        "edf": ("edf", {}),
+        "rm": ("rate_monotonic", {}),
+    }
     
     def __init__(self):
         self.processes = []
         self.time_quantum = 3  # Fixed time quantum
         self.min_processes = 3
         self.max_processes = 10
+        self.state_log = None  # Opt-in transition log, see enable_state_log
+        self.io_events = []  # Heap of pending I/O completions (time, seq, process)
+        self.io_devices = {}  # Device -> time its I/O queue drains
+        self.io_sequence = 0  # Keeps simultaneous I/O completions in FIFO order
+        self.aging_interval = None  # Wait that raises priority one level; None disables aging
+        self.lottery_seed = 0  # Lottery draws are reproducible for a given seed
+        self.share_accuracy = None  # Set by proportional-share runs, see measure_share_accuracy
+        self.horizon = None  # Periodic releases stop here; None = last arrival + hyperperiod
+        self.reject_infeasible = True  # Refuse real-time task sets that fail the schedulability test
+        self.deadline_stats = None  # Set by real-time runs
+        self.snapshot_interval = 64  # Simulated time between run snapshots; None disables
+        self.max_snapshots = 32  # Snapshots are thinned out beyond this
+        self.snapshot_spacing = None
+        self.snapshots = []  # Snapshots of the last run, oldest first
+        self.last_run = None  # What run() computed last, for incremental re-runs
+        self.next_snapshot = float("inf")
+        # Periodic checkpoints to disk, see enable_checkpoints
+        self.checkpoint_path = None
+        self.checkpoint_events = None
+        self.checkpoint_seconds = None
+        self.next_checkpoint = float("inf")
+        self.last_checkpoint = (0, 0.0)  # (events, wall clock) of the last checkpoint
+        self.checkpoint_written = None  # (gantt, time chart) entries on disk for this run
+        self.active_algorithm = None  # Key of the algorithm run() is executing
+        self.progress_callback = None  # Called as (completed, total); may raise SimulationCancelled
+
+    def enable_state_log(self, capacity=65536):
+        """Record state transitions of all processes in a shared ring buffer"""
+        self.state_log = StateLog(capacity)
+        for process in self.processes:
+            process.log = self.state_log
+        return self.state_log
 
     def validate_input(self, arrival_time, burst_time, priority):
         """Validates process parameters and enforces process limits."""
@@ -56,30 +466,362 @@ class CPUScheduler:
         if len(self.processes) < self.min_processes:
             raise ValueError(f"Need minimum {self.min_processes} processes to run scheduler")
 
-    def add_process(self, pid, arrival_time, burst_time, priority=0):
+    def add_process(self, pid, arrival_time, burst_time, priority=0, bursts=None, io_device=None,
+                    weight=None, deadline=None, period=None):
+        """Add a process. bursts optionally alternates CPU and I/O burst
+        lengths, starting and ending with CPU; burst_time is then their CPU total.
+        weight sets lottery/stride tickets explicitly. deadline and period
+        describe real-time jobs for EDF and rate-monotonic scheduling."""
+        if bursts:
+            if len(bursts) % 2 == 0 or any(b <= 0 for b in bursts):
+                raise ValueError("Bursts must alternate CPU and I/O, starting and ending with CPU")
+            burst_time = sum(bursts[0::2])
+        if weight is not None and weight <= 0:
+            raise ValueError("Weight must be positive")
+        if (deadline is not None and deadline <= 0) or (period is not None and period <= 0):
+            raise ValueError("Deadline and period must be positive")
         self.validate_input(arrival_time, burst_time, priority)
-        self.processes.append(Process(pid, arrival_time, burst_time, priority))
+        process = Process(pid, arrival_time, burst_time, priority, bursts, io_device, weight,
+                          deadline, period)
+        process.log = self.state_log
+        self.processes.append(process)
+
+    def reset_run(self):
+        """Reset processes, I/O queues and the state log before a scheduling run"""
+        for process in self.processes:
+            process.reset()
+        if self.state_log is not None:
+            self.state_log.clear()
+        self.io_events = []
+        self.io_devices = {}
+        self.io_sequence = 0
+
+    def begin_run(self, resume=None):
+        """Prepare a scheduling run and return its loop state as
+        (time, completed, gantt_chart, time_chart, saved locals).
+        resume is a (snapshot, gantt_data) pair from an earlier run of the
+        same algorithm; the run then continues from that snapshot."""
+        self.last_run = None
+        self.share_accuracy = None
+        self.deadline_stats = None
+        self.checkpoint_written = None
+        if resume is None:
+            self.reset_run()
+            self.snapshots = []
+            self.snapshot_spacing = self.snapshot_interval
+            self.next_snapshot = 0 if self.snapshot_spacing else float("inf")
+            self.last_checkpoint = (0, monotonic())
+            self.schedule_checkpoint(0)
+            return 0, 0, [], [], {}
+
+        snapshot, (gantt_chart, time_chart) = resume
+        saved = dict(snapshot["processes"])
+        for process in self.processes:
+            if process.pid in saved:
+                process.restore_state(saved[process.pid])
+            else:
+                process.reset()
+        by_pid = {p.pid: p for p in self.processes}
+        self.io_events = [(done, seq, by_pid[pid]) for done, seq, pid in snapshot["io_events"]]
+        self.io_devices = dict(snapshot["io_devices"])
+        self.io_sequence = snapshot["io_sequence"]
+        time = snapshot["time"]
+        if self.state_log is not None:
+            # Forget what the earlier run logged after the snapshot
+            self.state_log.rewind(snapshot.get("log_written"), time,
+                                  [p.pid for p in self.processes if p.state == "running"],
+                                  min((done for done, _, _ in self.io_events), default=time))
+        if self.snapshot_spacing is None:
+            self.snapshot_spacing = self.snapshot_interval
+        self.next_snapshot = time + self.snapshot_spacing if self.snapshot_spacing else float("inf")
+        self.last_checkpoint = (snapshot["gantt_length"], monotonic())
+        self.schedule_checkpoint(snapshot["gantt_length"])
+        return (time, snapshot["completed"],
+                gantt_chart[:snapshot["gantt_length"]],
+                time_chart[:snapshot["chart_length"]],
+                snapshot["locals"])
+
+    def take_snapshot(self, time, completed, gantt_chart, time_chart, **saved):
+        """Capture the loop state at the top of an iteration, keeping it for
+        incremental re-runs and/or writing it as a checkpoint when either is
+        due. Only processes that have arrived are saved; chart prefixes never
+        change, so only their lengths are kept."""
+        keep = time >= self.next_snapshot
+        write = False
+        if len(gantt_chart) >= self.next_checkpoint:
+            if self.progress_callback is not None:
+                self.progress_callback(completed, len(self.processes))
+            write = self.checkpoint_ready(len(gantt_chart))
+        if not (keep or write):
+            return
+        snapshot = {
+            "time": time,
+            "completed": completed,
+            "gantt_length": len(gantt_chart),
+            "chart_length": len(time_chart),
+            "locals": saved,
+            "processes": [(p.pid, p.save_state()) for p in self.processes
+                          if p.arrival_time < time],
+            "io_events": [(done, seq, p.pid) for done, seq, p in self.io_events],
+            "io_devices": list(self.io_devices.items()),
+            "io_sequence": self.io_sequence,
+            "log_written": self.state_log.written if self.state_log is not None else None,
+        }
+        if keep:
+            self.snapshots.append(snapshot)
+            if len(self.snapshots) > self.max_snapshots:
+                # Keep memory bounded: drop every other snapshot, space them wider
+                self.snapshots = self.snapshots[::2]
+                self.snapshot_spacing *= 2
+            self.next_snapshot = time + self.snapshot_spacing
+        if write:
+            self.write_checkpoint(snapshot, gantt_chart, time_chart)
+
+    def enable_checkpoints(self, path, every_events=None, every_seconds=None):
+        """Write a checkpoint of runs started through run() to path (plus
+        path.run and path.chart) every every_events scheduling events and/or
+        every_seconds of wall time."""
+        if not every_events and not every_seconds:
+            raise ValueError("Checkpoint interval required (events or seconds)")
+        self.checkpoint_path = path
+        self.checkpoint_events = every_events
+        self.checkpoint_seconds = every_seconds
+
+    def schedule_checkpoint(self, events):
+        """Set the event count at which a checkpoint, clock check or progress
+        report is next due"""
+        self.next_checkpoint = float("inf")
+        if self.progress_callback is not None:
+            self.next_checkpoint = events + CLOCK_CHECK_EVENTS
+        if self.checkpoint_path is None or self.active_algorithm is None:
+            return
+        if self.checkpoint_events:
+            self.next_checkpoint = min(self.next_checkpoint,
+                                       self.last_checkpoint[0] + self.checkpoint_events)
+        if self.checkpoint_seconds:
+            self.next_checkpoint = min(self.next_checkpoint, events + CLOCK_CHECK_EVENTS)
 
-    def round_robin(self):
+    def checkpoint_ready(self, events):
+        last_events, last_clock = self.last_checkpoint
+        if self.checkpoint_path is None or self.active_algorithm is None:
+            self.schedule_checkpoint(events)
+            return False
+        if ((self.checkpoint_events and events - last_events >= self.checkpoint_events) or
+                (self.checkpoint_seconds and monotonic() - last_clock >= self.checkpoint_seconds)):
+            return True
+        self.schedule_checkpoint(events)
+        return False
+
+    def write_checkpoint(self, snapshot, gantt_chart, time_chart):
+        """Write a versioned checkpoint of the run in three files: path.run
+        holds the settings and process definitions, written once per run;
+        path.chart gets only the chart entries and final process states
+        added since the last checkpoint; path itself is a small compressed
+        header with the rest of the snapshot, replaced atomically once the
+        other files are on disk."""
+        path = self.checkpoint_path
+        if self.checkpoint_written is None:
+            # A new run: its first header must not pair with an older run's files
+            if os.path.exists(path):
+                os.remove(path)
+            run = {
+                "settings": {"time_quantum": self.time_quantum,
+                             "aging_interval": self.aging_interval,
+                             "lottery_seed": self.lottery_seed,
+                             "horizon": self.horizon,
+                             "max_processes": self.max_processes},
+                "processes": [list(p.definition()) for p in self.processes],
+            }
+            with gzip.open(path + ".run.tmp", "wt", encoding="utf-8") as f:
+                f.write(json.dumps(run, separators=(",", ":")))
+            os.replace(path + ".run.tmp", path + ".run")
+            open(path + ".chart", "w").close()
+            self.checkpoint_written = (0, 0, set())
+
+        # Completed processes never change again, so each is written once
+        gantt_written, chart_written, finished = self.checkpoint_written
+        state_field = Process.RUN_FIELDS.index("state")
+        live = []
+        with open(path + ".chart", "a") as f:
+            for pid in gantt_chart[gantt_written:snapshot["gantt_length"]]:
+                f.write(json.dumps(["g", pid]) + "\n")
+            for start, end in time_chart[chart_written:snapshot["chart_length"]]:
+                f.write(json.dumps(["t", start, end]) + "\n")
+            for pid, state in snapshot["processes"]:
+                if state[state_field] != "completed":
+                    live.append((pid, state))
+                elif pid not in finished:
+                    f.write(json.dumps(["p", pid, state]) + "\n")
+                    finished.add(pid)
+            f.flush()
+            os.fsync(f.fileno())
+        self.checkpoint_written = (snapshot["gantt_length"], snapshot["chart_length"], finished)
+
+        checkpoint = {
+            "version": CHECKPOINT_VERSION,
+            "algorithm": self.active_algorithm,
+            "finished": len(finished),
+            "snapshot": dict(snapshot, processes=live),
+        }
+        # dumps() uses the C encoder; dump() streams small pure Python chunks
+        with gzip.open(path + ".tmp", "wt", encoding="utf-8") as f:
+            f.write(json.dumps(checkpoint, separators=(",", ":")))
+        os.replace(path + ".tmp", path)
+        self.last_checkpoint = (snapshot["gantt_length"], monotonic())
+        self.schedule_checkpoint(snapshot["gantt_length"])
+
+    def resume_checkpoint(self, path):
+        """Rebuild the processes and settings saved in a checkpoint and finish
+        its run. The result is identical to an uninterrupted run."""
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {checkpoint.get('version')}")
+        with gzip.open(path + ".run", "rt", encoding="utf-8") as f:
+            run = json.load(f)
+        settings = run["settings"]
+        self.time_quantum = settings["time_quantum"]
+        self.aging_interval = settings["aging_interval"]
+        self.lottery_seed = settings.get("lottery_seed", 0)
+        self.horizon = settings.get("horizon")
+        self.max_processes = settings["max_processes"]
+        self.processes = []
+        for definition in run["processes"]:
+            process = Process(*definition)
+            process.log = self.state_log
+            self.processes.append(process)
+        snapshot = checkpoint["snapshot"]
+        snapshot["io_events"] = [tuple(event) for event in snapshot["io_events"]]
+        snapshot["log_written"] = None  # The log restarts at the checkpoint
+
+        # The chart file may run past the header if writing was interrupted
+        gantt_chart, time_chart, finished = [], [], []
+        with open(path + ".chart") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                entry = json.loads(line)
+                if entry[0] == "g" and len(gantt_chart) < snapshot["gantt_length"]:
+                    gantt_chart.append(entry[1])
+                elif entry[0] == "t" and len(time_chart) < snapshot["chart_length"]:
+                    time_chart.append((entry[1], entry[2]))
+                elif entry[0] == "p" and len(finished) < checkpoint["finished"]:
+                    finished.append((entry[1], entry[2]))
+        if (len(gantt_chart) < snapshot["gantt_length"] or len(time_chart) < snapshot["chart_length"] or
+                len(finished) < checkpoint["finished"]):
+            raise ValueError("Checkpoint chart file is incomplete")
+        snapshot["processes"] = finished + snapshot["processes"]
+        self.snapshots = []
+        self.snapshot_spacing = None
+        return self.run(checkpoint["algorithm"], resume=(snapshot, (gantt_chart, time_chart)))
+
+    def processes_by_pid(self, pids):
+        by_pid = {p.pid: p for p in self.processes}
+        return [by_pid[pid] for pid in pids]
+
+    def run_settings(self):
+        return (self.time_quantum, self.aging_interval, self.lottery_seed,
+                self.horizon, self.reject_infeasible)
+
+    def run(self, algorithm, resume=None):
+        """Run an algorithm by its ALGORITHMS key. If the previous run used the
+        same algorithm and settings and processes have only been added since,
+        resume from the latest snapshot at or before the earliest new arrival
+        and recompute just the rest of the schedule."""
+        method_name, kwargs = self.ALGORITHMS[algorithm]
+        if resume is None:
+            resume = self.find_resume_point(algorithm)
+        self.active_algorithm = algorithm
+        try:
+            gantt_data = getattr(self, method_name)(resume=resume, **kwargs)
+        finally:
+            self.active_algorithm = None
+        self.last_run = (algorithm, self.run_settings(),
+                         [p.definition() for p in self.processes], gantt_data)
+        return gantt_data
+
+    def find_resume_point(self, algorithm):
+        if self.last_run is None:
+            return None
+        last_algorithm, settings, definitions, gantt_data = self.last_run
+        known = len(definitions)
+        if (last_algorithm != algorithm or settings != self.run_settings() or
+                len(self.processes) <= known or
+                [p.definition() for p in self.processes[:known]] != definitions):
+            return None
+        first_arrival = min(p.arrival_time for p in self.processes[known:])
+        usable = [s for s in self.snapshots if s["time"] <= first_arrival]
+        if not usable:
+            return None
+        self.snapshots = usable
+        return usable[-1], gantt_data
+
+    def start_io(self, process, time):
+        """Block a process for its next I/O burst, queueing behind earlier
+        requests on the same device"""
+        process.burst_index += 1
+        duration = process.bursts[process.burst_index]
+        start = time
+        if process.io_device is not None:
+            start = max(time, self.io_devices.get(process.io_device, 0))
+            self.io_devices[process.io_device] = start + duration
+        done = start + duration
+        process.io_time += done - time
+        process.update_state("blocked", time)
+        heapq.heappush(self.io_events, (done, self.io_sequence, process))
+        self.io_sequence += 1
+
+    def complete_io(self, time):
+        """Wake processes whose I/O finished by time, in completion order"""
+        woken = []
+        while self.io_events and self.io_events[0][0] <= time:
+            done, _, process = heapq.heappop(self.io_events)
+            process.burst_index += 1
+            process.burst_remaining = process.bursts[process.burst_index]
+            process.update_state("ready", done)
+            process.ready_since = done
+            woken.append(process)
+        return woken
+
+    def next_event_time(self, time):
+        """Earliest future arrival or I/O completion, so idle time is skipped"""
+        upcoming = [p.arrival_time for p in self.processes if p.arrival_time > time]
+        if self.io_events:
+            upcoming.append(self.io_events[0][0])
+        return min(upcoming, default=time + 1)
+
+    def complete_process(self, process, time):
+        """Record completion metrics for a finished process"""
+        process.completion_time = time
+        process.turnaround_time = time - process.arrival_time
+        process.waiting_time = process.turnaround_time - process.burst_time - process.io_time
+        process.update_state("completed", time)
+
+    def round_robin(self, resume=None):
         """Round Robin scheduling with fixed quantum=3"""
         self.check_minimum_processes()
-        time = 0
-        queue = []
-        gantt_chart = []
-        time_chart = []  # Track execution times
-        completed_processes = 0
+        time, completed_processes, gantt_chart, time_chart, saved = self.begin_run(resume)
+        queue = self.processes_by_pid(saved.get("queue", []))
         
         while completed_processes < len(self.processes):
+            if time >= self.next_snapshot or len(gantt_chart) >= self.next_checkpoint:
+                self.take_snapshot(time, completed_processes, gantt_chart, time_chart,
+                                   queue=[p.pid for p in queue])
+
+            # Processes back from I/O rejoin in completion order
+            queue.extend(self.complete_io(time))
+
             # Add newly arrived processes to queue
             for process in self.processes:
                 if (process.arrival_time <= time and 
                     process.remaining_time > 0 and 
+                    process.state != "blocked" and
                     process not in queue):
                     queue.append(process)
             
             if queue:
                 current_process = queue.pop(0)
-                execution_time = min(self.time_quantum, current_process.remaining_time)
+                execution_time = min(self.time_quantum, current_process.burst_remaining)
                 
                 # Record execution period
                 gantt_chart.append(current_process.pid)
@@ -88,142 +830,618 @@ class CPUScheduler:
                 
                 time += execution_time
                 current_process.remaining_time -= execution_time
+                current_process.burst_remaining -= execution_time
                 
                 if current_process.remaining_time == 0:
-                    current_process.update_state("completed", time)
-                    current_process.completion_time = time
-                    current_process.turnaround_time = time - current_process.arrival_time
-                    current_process.waiting_time = current_process.turnaround_time - current_process.burst_time
+                    self.complete_process(current_process, time)
                     completed_processes += 1
+                elif current_process.burst_remaining == 0:
+                    self.start_io(current_process, time)
                 else:
                     queue.append(current_process)
                     current_process.update_state("ready", time)
             else:
-                time += 1
+                time = self.next_event_time(time)
         
         return gantt_chart, time_chart
 
-    def sjf_nonpreemptive(self):
+    def sjf_nonpreemptive(self, resume=None):
         """Non-preemptive SJF with improved timing"""
         self.check_minimum_processes()
-        time = 0
-        completed_processes = 0
-        gantt_chart = []
-        time_chart = []
-        remaining_processes = self.processes.copy()
+        time, completed_processes, gantt_chart, time_chart, _ = self.begin_run(resume)
+        remaining_processes = [p for p in self.processes if p.remaining_time > 0]
 
         while completed_processes < len(self.processes):
+            if time >= self.next_snapshot or len(gantt_chart) >= self.next_checkpoint:
+                self.take_snapshot(time, completed_processes, gantt_chart, time_chart)
+            self.complete_io(time)
             ready_processes = [p for p in remaining_processes 
-                             if p.arrival_time <= time]
+                             if p.arrival_time <= time and p.state != "blocked"]
             if not ready_processes:
-                time += 1
+                time = self.next_event_time(time)
                 continue
 
+            # Shortest next CPU burst; the whole job for CPU-bound processes
             current_process = min(ready_processes, 
-                                key=lambda p: (p.burst_time, p.arrival_time, p.pid))
+                                key=lambda p: (p.burst_remaining, p.arrival_time, p.pid))
             
             gantt_chart.append(current_process.pid)
             start_time = time
-            time += current_process.burst_time
+            time += current_process.burst_remaining
             time_chart.append((start_time, time))
             
             current_process.update_state("running", start_time)
-            current_process.update_state("completed", time)
-            current_process.completion_time = time
-            current_process.turnaround_time = time - current_process.arrival_time
-            current_process.waiting_time = current_process.turnaround_time - current_process.burst_time
+            current_process.remaining_time -= current_process.burst_remaining
+            current_process.burst_remaining = 0
             
-            completed_processes += 1
-            remaining_processes.remove(current_process)
+            if current_process.remaining_time == 0:
+                self.complete_process(current_process, time)
+                completed_processes += 1
+                remaining_processes.remove(current_process)
+            else:
+                self.start_io(current_process, time)
 
         return gantt_chart, time_chart
 
-    def sjf_preemptive(self):
+    def sjf_preemptive(self, resume=None):
         """Preemptive Shortest Job First scheduling with timing data"""
-        time = 0
-        completed = 0
-        gantt_chart = []
-        time_chart = []
-        last_switch = None
-        current_pid = None
+        time, completed, gantt_chart, time_chart, saved = self.begin_run(resume)
+        last_switch = saved.get("last_switch")
+        current_pid = saved.get("current_pid")
+        previous = self.processes_by_pid(saved.get("previous", []))
+        previous = previous[0] if previous else None
         
         while completed < len(self.processes):
+            if time >= self.next_snapshot or len(gantt_chart) >= self.next_checkpoint:
+                self.take_snapshot(
+                    time, completed, gantt_chart, time_chart, last_switch=last_switch,
+                    current_pid=current_pid, previous=[previous.pid] if previous else [])
+            self.complete_io(time)
             ready = [p for p in self.processes 
-                    if p.arrival_time <= time and p.remaining_time > 0]
+                    if p.arrival_time <= time and p.remaining_time > 0 and p.state != "blocked"]
             if not ready:
-                time += 1
+                time = self.next_event_time(time)
                 continue
 
-            # Break ties using process ID
-            current = min(ready, key=lambda p: (p.remaining_time, p.pid))
+            # Shortest remaining CPU burst, break ties using process ID
+            current = min(ready, key=lambda p: (p.burst_remaining, p.pid))
             
             # Record process switch
             if current.pid != current_pid:
                 if current_pid is not None:
                     time_chart.append((last_switch, time))
+                    previous.update_state("ready", time)
                 gantt_chart.append(current.pid)
                 last_switch = time
                 current_pid = current.pid
+                previous = current
 
-            current.state = "running"
-            if current.response_time == -1:
-                current.response_time = time - current.arrival_time
+            current.update_state("running", time)
 
             time += 1
             current.remaining_time -= 1
+            current.burst_remaining -= 1
 
-            if current.remaining_time == 0:
+            if current.burst_remaining == 0:
                 time_chart.append((last_switch, time))
-                current.completion_time = time
-                current.turnaround_time = time - current.arrival_time
-                current.waiting_time = current.turnaround_time - current.burst_time
-                current.state = "completed"
-                completed += 1
+                if current.remaining_time == 0:
+                    self.complete_process(current, time)
+                    completed += 1
+                else:
+                    self.start_io(current, time)
                 current_pid = None
 
         return gantt_chart, time_chart
 
-    def priority_scheduling(self, preemptive=False):
+    def priority_scheduling(self, preemptive=False, resume=None):
         """Priority scheduling with improved timing"""
-        time = 0
-        completed_processes = 0
-        gantt_chart = []
-        time_chart = []
-        last_switch = 0
+        if self.aging_interval:
+            return self.priority_aging(preemptive, resume)
+        time, completed_processes, gantt_chart, time_chart, saved = self.begin_run(resume)
+        last_switch = saved.get("last_switch", 0)
+        previous = self.processes_by_pid(saved.get("previous", []))
+        previous = previous[0] if previous else None
         
         while completed_processes < len(self.processes):
+            if time >= self.next_snapshot or len(gantt_chart) >= self.next_checkpoint:
+                self.take_snapshot(
+                    time, completed_processes, gantt_chart, time_chart, last_switch=last_switch,
+                    previous=[previous.pid] if previous else [])
+            self.complete_io(time)
             ready_processes = [p for p in self.processes 
-                             if p.arrival_time <= time and p.remaining_time > 0]
+                             if p.arrival_time <= time and p.remaining_time > 0 and p.state != "blocked"]
             if not ready_processes:
-                time += 1
+                time = self.next_event_time(time)
                 continue
 
             current_process = min(ready_processes, 
                                 key=lambda p: (p.priority, p.pid))
             
-            if not gantt_chart or gantt_chart[-1] != current_process.pid:
-                if gantt_chart:  # Record previous execution period
+            # A process returning from I/O starts a new execution period
+            if (not gantt_chart or gantt_chart[-1] != current_process.pid or
+                    previous is None):
+                # Close a preempted process's period; finished ones closed theirs
+                if previous is not None and previous.state == "running":
                     time_chart.append((last_switch, time))
+                    previous.update_state("ready", time)
                 gantt_chart.append(current_process.pid)
                 last_switch = time
+                previous = current_process
+            current_process.update_state("running", time)
                 
             if preemptive:
                 time += 1
                 current_process.remaining_time -= 1
+                current_process.burst_remaining -= 1
             else:
-                exec_time = current_process.remaining_time
+                exec_time = current_process.burst_remaining
                 time += exec_time
-                current_process.remaining_time = 0
+                current_process.remaining_time -= exec_time
+                current_process.burst_remaining = 0
 
-            if current_process.remaining_time == 0:
+            if current_process.burst_remaining == 0:
                 time_chart.append((last_switch, time))
-                current_process.completion_time = time
-                current_process.turnaround_time = time - current_process.arrival_time
-                current_process.waiting_time = current_process.turnaround_time - current_process.burst_time
+                if current_process.remaining_time == 0:
+                    self.complete_process(current_process, time)
+                    completed_processes += 1
+                else:
+                    self.start_io(current_process, time)
+                    previous = None
+
+        return gantt_chart, time_chart
+
+    def priority_aging(self, preemptive=False, resume=None):
+        """Priority scheduling where waiting processes age towards higher priority.
+        Effective priority improves by one level per aging_interval of waiting.
+        All waiting processes age at the same rate, so ordering by the time
+        invariant key priority * aging_interval + ready_since is equivalent and
+        the ready set never needs rescanning."""
+        time, completed_processes, gantt_chart, time_chart, saved = self.begin_run(resume)
+        interval = self.aging_interval
+        by_pid = {p.pid: p for p in self.processes}
+        current_process = by_pid.get(saved.get("current_pid"))
+        last_switch = saved.get("last_switch", 0)
+        ready = IndexedHeap()
+
+        def make_ready(process, since):
+            process.ready_since = since
+            ready.push(process.pid, (process.priority * interval + since, process.pid))
+
+        # Processes that were never admitted have no ready_since yet
+        arrivals = sorted((p for p in self.processes if p.ready_since == -1),
+                          key=lambda p: (p.arrival_time, p.pid))
+        for process in self.processes:
+            if process.ready_since != -1 and process.state == "ready":
+                make_ready(process, process.ready_since)
+        next_arrival = 0
+
+        while completed_processes < len(self.processes):
+            if time >= self.next_snapshot or len(gantt_chart) >= self.next_checkpoint:
+                self.take_snapshot(
+                    time, completed_processes, gantt_chart, time_chart, last_switch=last_switch,
+                    current_pid=current_process.pid if current_process else None)
+            for process in self.complete_io(time):
+                make_ready(process, process.ready_since)
+            while (next_arrival < len(arrivals) and
+                   arrivals[next_arrival].arrival_time <= time):
+                process = arrivals[next_arrival]
+                make_ready(process, process.arrival_time)
+                next_arrival += 1
+
+            if current_process is None and not ready:
+                time = self.next_event_time(time)
+                continue
+
+            # Preempt once the best waiter has aged a full level past the
+            # running process, which competes as if it had just become ready
+            if (current_process is not None and ready and
+                    ready.peek()[0][0] + interval <=
+                    current_process.priority * interval + time):
+                time_chart.append((last_switch, time))
+                current_process.update_state("ready", time)
+                make_ready(current_process, time)
+                current_process = None
+
+            if current_process is None:
+                _, pid = ready.pop()
+                current_process = by_pid[pid]
+                gantt_chart.append(pid)
+                last_switch = time
+                current_process.update_state("running", time)
+
+            exec_time = 1 if preemptive else current_process.burst_remaining
+            time += exec_time
+            current_process.remaining_time -= exec_time
+            current_process.burst_remaining -= exec_time
+
+            if current_process.burst_remaining == 0:
+                time_chart.append((last_switch, time))
+                if current_process.remaining_time == 0:
+                    self.complete_process(current_process, time)
+                    completed_processes += 1
+                else:
+                    self.start_io(current_process, time)
+                current_process = None
+
+        return gantt_chart, time_chart
+
+    def lottery(self, resume=None):
+        """Lottery scheduling: every quantum goes to the holder of a ticket drawn
+        from the ready processes. Tickets live in a Fenwick tree, so a draw is
+        O(log n) however many processes are runnable."""
+        self.check_minimum_processes()
+        time, completed_processes, gantt_chart, time_chart, saved = self.begin_run(resume)
+        rng = random.Random(self.lottery_seed)
+        if "rng_state" in saved:
+            version, state, gauss = saved["rng_state"]
+            rng.setstate((version, tuple(state), gauss))
+        share_clock = saved.get("share_clock", 0)
+        slots = {p.pid: slot for slot, p in enumerate(self.processes)}
+        tickets = FenwickTree(len(self.processes))
+
+        def make_ready(process, since):
+            process.ready_since = since
+            process.share_mark = share_clock
+            tickets.add(slots[process.pid], process.tickets())
+
+        def leave(process):
+            tickets.add(slots[process.pid], -process.tickets())
+            process.ideal_time += process.tickets() * (share_clock - process.share_mark)
+
+        arrivals = sorted((p for p in self.processes if p.ready_since == -1),
+                          key=lambda p: (p.arrival_time, p.pid))
+        for process in self.processes:
+            if process.ready_since != -1 and process.state == "ready":
+                tickets.add(slots[process.pid], process.tickets())
+        next_arrival = 0
+
+        while completed_processes < len(self.processes):
+            if time >= self.next_snapshot or len(gantt_chart) >= self.next_checkpoint:
+                self.take_snapshot(time, completed_processes, gantt_chart, time_chart,
+                                   rng_state=rng.getstate(), share_clock=share_clock)
+            for process in self.complete_io(time):
+                make_ready(process, process.ready_since)
+            while (next_arrival < len(arrivals) and
+                   arrivals[next_arrival].arrival_time <= time):
+                make_ready(arrivals[next_arrival], arrivals[next_arrival].arrival_time)
+                next_arrival += 1
+
+            if not tickets.total:
+                time = self.next_event_time(time)
+                continue
+
+            current_process = self.processes[tickets.find(rng.randrange(tickets.total))]
+            execution_time = min(self.time_quantum, current_process.burst_remaining)
+            gantt_chart.append(current_process.pid)
+            time_chart.append((time, time + execution_time))
+            current_process.update_state("running", time)
+
+            # Under exact proportional share each ready process would get
+            # tickets / total of this slice
+            share_clock += execution_time / tickets.total
+            time += execution_time
+            current_process.remaining_time -= execution_time
+            current_process.burst_remaining -= execution_time
+
+            if current_process.remaining_time == 0:
+                leave(current_process)
+                self.complete_process(current_process, time)
                 completed_processes += 1
+            elif current_process.burst_remaining == 0:
+                leave(current_process)
+                self.start_io(current_process, time)
+            else:
+                current_process.update_state("ready", time)
 
+        self.share_accuracy = self.measure_share_accuracy()
         return gantt_chart, time_chart
 
+    def stride(self, resume=None):
+        """Stride scheduling: the ready process with the lowest pass runs for a
+        quantum, then its pass advances by STRIDE1 // tickets per time unit.
+        Deterministic proportional share; ties go to the lower pid."""
+        self.check_minimum_processes()
+        time, completed_processes, gantt_chart, time_chart, saved = self.begin_run(resume)
+        share_clock = saved.get("share_clock", 0)
+        global_pass = saved.get("global_pass", 0)
+        total_tickets = 0
+        by_pid = {p.pid: p for p in self.processes}
+        ready = IndexedHeap()
+
+        def make_ready(process, since):
+            nonlocal total_tickets
+            process.ready_since = since
+            process.share_mark = share_clock
+            # Joining processes start level with the others instead of
+            # cashing in time spent away
+            process.pass_value = max(process.pass_value, global_pass)
+            ready.push(process.pid, (process.pass_value, process.pid))
+            total_tickets += process.tickets()
+
+        def leave(process):
+            nonlocal total_tickets
+            ready.remove(process.pid)
+            total_tickets -= process.tickets()
+            process.ideal_time += process.tickets() * (share_clock - process.share_mark)
+
+        arrivals = sorted((p for p in self.processes if p.ready_since == -1),
+                          key=lambda p: (p.arrival_time, p.pid))
+        for process in self.processes:
+            if process.ready_since != -1 and process.state == "ready":
+                ready.push(process.pid, (process.pass_value, process.pid))
+                total_tickets += process.tickets()
+        next_arrival = 0
+
+        while completed_processes < len(self.processes):
+            if time >= self.next_snapshot or len(gantt_chart) >= self.next_checkpoint:
+                self.take_snapshot(time, completed_processes, gantt_chart, time_chart,
+                                   share_clock=share_clock, global_pass=global_pass)
+            for process in self.complete_io(time):
+                make_ready(process, process.ready_since)
+            while (next_arrival < len(arrivals) and
+                   arrivals[next_arrival].arrival_time <= time):
+                make_ready(arrivals[next_arrival], arrivals[next_arrival].arrival_time)
+                next_arrival += 1
+
+            if not ready:
+                time = self.next_event_time(time)
+                continue
+
+            (global_pass, _), pid = ready.peek()
+            current_process = by_pid[pid]
+            execution_time = min(self.time_quantum, current_process.burst_remaining)
+            gantt_chart.append(pid)
+            time_chart.append((time, time + execution_time))
+            current_process.update_state("running", time)
+
+            share_clock += execution_time / total_tickets
+            time += execution_time
+            current_process.remaining_time -= execution_time
+            current_process.burst_remaining -= execution_time
+            current_process.pass_value += STRIDE1 // current_process.tickets() * execution_time
+
+            if current_process.remaining_time == 0:
+                leave(current_process)
+                self.complete_process(current_process, time)
+                completed_processes += 1
+            elif current_process.burst_remaining == 0:
+                leave(current_process)
+                self.start_io(current_process, time)
+            else:
+                ready.update(pid, (current_process.pass_value, pid))
+                current_process.update_state("ready", time)
+
+        self.share_accuracy = self.measure_share_accuracy()
+        return gantt_chart, time_chart
+
+    def measure_share_accuracy(self):
+        """1 minus the fraction of CPU time given to the wrong process, compared
+        with exact proportional sharing among the processes ready at each moment"""
+        total = sum(p.burst_time for p in self.processes)
+        error = sum(abs(p.burst_time - p.ideal_time) for p in self.processes)
+        return 1 - error / (2 * total) if total else 1.0
+
+    def edf(self, resume=None):
+        """Earliest Deadline First: the released job with the earliest absolute
+        deadline runs, preempting on every release"""
+        return self.real_time("edf", resume)
+
+    def rate_monotonic(self, resume=None):
+        """Rate-monotonic: fixed priorities by period, shortest period first;
+        processes without a period run in the background"""
+        return self.real_time("rm", resume)
+
+    def real_time(self, policy, resume=None):
+        """Event-driven engine for EDF and rate-monotonic scheduling. Time jumps
+        from one job completion or release to the next. Real-time runs use
+        each process's burst_time per job and always start from time 0, so
+        they are not snapshotted and cannot be resumed or checkpointed;
+        progress_callback gets (jobs finished, jobs released in total)."""
+        if resume is not None:
+            raise ValueError(f"{policy.upper()} runs cannot resume from a snapshot")
+        if self.checkpoint_path is not None:
+            raise ValueError(f"{policy.upper()} runs do not support checkpoints; "
+                             "set checkpoint_path = None to run without them")
+        self.check_minimum_processes()
+        if self.reject_infeasible:
+            feasible, reason = self.schedulability(policy)
+            if feasible is None:
+                raise ValueError(f"Cannot decide schedulability under {policy.upper()}: {reason}; "
+                                 "set reject_infeasible = False to run anyway")
+            if not feasible:
+                raise ValueError(f"Task set is not schedulable under {policy.upper()}: {reason}")
+        horizon = self.real_time_horizon()
+        time, completed_processes, gantt_chart, time_chart, _ = self.begin_run()
+        by_pid = {p.pid: p for p in self.processes}
+        jobs_left = {}
+        pending = dict.fromkeys(by_pid, 0)  # Released, unfinished jobs per process
+        waited = dict.fromkeys(by_pid, 0)  # Ready but not running, summed over jobs
+        for p in self.processes:
+            if p.period:
+                p.jobs = max(len(range(p.arrival_time, horizon, p.period)), 1)
+            jobs_left[p.pid] = p.jobs
+            p.remaining_time = p.jobs * p.burst_time
+        total_jobs = sum(jobs_left.values())
+        finished_jobs = 0
+        events = 0
+        releases = [(p.arrival_time, p.pid) for p in self.processes]
+        heapq.heapify(releases)
+        ready = []  # Heap of (key, pid, release, job); job = [deadline, remaining]
+        tardiness = []  # Per finished job with a finite deadline
+        running = None
+
+        while completed_processes < len(self.processes):
+            events += 1
+            if self.progress_callback is not None and events % CLOCK_CHECK_EVENTS == 0:
+                self.progress_callback(finished_jobs, total_jobs)
+            while releases and releases[0][0] <= time:
+                release, pid = heapq.heappop(releases)
+                process = by_pid[pid]
+                deadline = release + process.relative_deadline()
+                key = deadline if policy == "edf" else (process.period or float("inf"))
+                heapq.heappush(ready, (key, pid, release, [deadline, process.burst_time]))
+                pending[pid] += 1
+                if process.state == "blocked":
+                    process.update_state("ready", release)
+                if process.period and release + process.period < horizon:
+                    heapq.heappush(releases, (release + process.period, pid))
+
+            if not ready:
+                time = releases[0][0]
+                continue
+
+            _, pid, release, job = ready[0]
+            process = by_pid[pid]
+            end = time + job[1]
+            if releases:
+                end = min(end, releases[0][0])
+            if running is not None and running is not process and running.state == "running":
+                running.update_state("ready", time)
+            if gantt_chart and gantt_chart[-1] == pid and time_chart[-1][1] == time:
+                time_chart[-1] = (time_chart[-1][0], end)
+            else:
+                gantt_chart.append(pid)
+                time_chart.append((time, end))
+            process.update_state("running", time)
+            running = process
+
+            job[1] -= end - time
+            process.remaining_time -= end - time
+            time = end
+
+            if job[1] == 0:
+                heapq.heappop(ready)
+                if job[0] != float("inf"):
+                    tardiness.append(max(0, time - job[0]))
+                jobs_left[pid] -= 1
+                pending[pid] -= 1
+                finished_jobs += 1
+                waited[pid] += time - release - process.burst_time
+                if jobs_left[pid] == 0:
+                    self.complete_process(process, time)
+                    process.waiting_time = waited[pid]
+                    completed_processes += 1
+                elif not pending[pid]:
+                    # Idle until its next job is released
+                    process.update_state("blocked", time)
+
+        self.deadline_stats = self.summarize_tardiness(tardiness)
+        return gantt_chart, time_chart
+
+    def real_time_horizon(self):
+        """End of periodic releases: horizon if set, else one hyperperiod after
+        the last arrival. Hyperperiods grow with the product of coprime
+        periods, so past MAX_DEFAULT_HORIZON an explicit horizon is required."""
+        if self.horizon is not None:
+            return self.horizon
+        periods = [p.period for p in self.processes if p.period]
+        hyperperiod = math.lcm(*periods) if periods else 1
+        if hyperperiod > MAX_DEFAULT_HORIZON:
+            raise ValueError(f"Hyperperiod {hyperperiod} is too long to simulate; set horizon explicitly")
+        last_arrival = max((p.arrival_time for p in self.processes), default=0)
+        return last_arrival + hyperperiod
+
+    @staticmethod
+    def summarize_tardiness(tardiness):
+        """Deadline miss ratio and tardiness percentiles over finished jobs"""
+        ordered = sorted(tardiness)
+        missed = sum(1 for t in ordered if t > 0)
+
+        def percentile(fraction):
+            if not ordered:
+                return 0
+            return ordered[min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1)]
+
+        return {
+            "jobs": len(ordered),
+            "missed": missed,
+            "miss_ratio": missed / len(ordered) if ordered else 0,
+            "tardiness_p50": percentile(0.50),
+            "tardiness_p95": percentile(0.95),
+            "tardiness_p99": percentile(0.99),
+            "tardiness_max": ordered[-1] if ordered else 0,
+        }
+
+    def schedulability(self, policy):
+        """Fast feasibility check for the periodic processes, assuming they all
+        release together (the worst case). Returns (feasible, reason), with
+        feasible None when a test exceeds MAX_ANALYSIS_STEPS.
+        EDF: utilization test, exact for deadlines >= periods, otherwise the
+        density test, then processor demand over a bounded interval (QPA).
+        RM: Liu & Layland bound, then exact response time analysis."""
+        tasks = sorted(((p.period, p.burst_time, min(p.relative_deadline(), p.period))
+                        for p in self.processes if p.period), key=lambda task: task[0])
+        if not tasks:
+            return True, ""
+        utilization = sum(c / t for t, c, _ in tasks)
+        if utilization > 1:
+            return False, f"utilization {utilization:.3f} exceeds 1"
+
+        if policy == "edf":
+            if sum(c / d for t, c, d in tasks) <= 1:
+                return True, ""
+            return self.processor_demand_test(tasks, utilization)
+
+        n = len(tasks)
+        if all(d == t for t, _, d in tasks) and utilization <= n * (2 ** (1 / n) - 1):
+            return True, ""
+        for i, (period, cost, deadline) in enumerate(tasks):
+            response = cost + sum(c for _, c, _ in tasks[:i])
+            for _ in range(MAX_ANALYSIS_STEPS):
+                if response > deadline:
+                    break
+                updated = cost + sum(math.ceil(response / t) * c for t, c, _ in tasks[:i])
+                if updated == response:
+                    break
+                response = updated
+            else:
+                return None, f"response time analysis of a period-{period} task did not converge"
+            if response > deadline:
+                return False, f"response time {response} of a period-{period} task exceeds its deadline {deadline}"
+        return True, ""
+
+    @staticmethod
+    def processor_demand_test(tasks, utilization):
+        """Quick Processor-demand Analysis (Zhang & Burns) of (period, cost,
+        deadline) tasks. Demand only needs checking up to the smaller of the
+        La bound and the synchronous busy period; QPA then walks back from
+        there, visiting few of the absolute deadlines before it."""
+        def demand(t):
+            return sum(((t - d) // p + 1) * c for p, c, d in tasks if t >= d)
+
+        def last_deadline_before(t):
+            return max(((t - d - 1) // p) * p + d for p, c, d in tasks if t > d)
+
+        # Synchronous busy period: the first time all released work is done
+        busy = sum(c for _, c, _ in tasks)
+        for _ in range(MAX_ANALYSIS_STEPS):
+            updated = sum(math.ceil(busy / p) * c for p, c, _ in tasks)
+            if updated == busy:
+                break
+            busy = updated
+        else:
+            busy = None
+        bound = busy
+        if utilization < 1:
+            la = max(max(d for _, _, d in tasks),
+                     sum((p - d) * c / p for p, c, d in tasks) / (1 - utilization))
+            bound = math.floor(la) if bound is None else min(bound, math.floor(la))
+        if bound is None:
+            return None, "processor demand interval is unbounded at full utilization"
+
+        first_deadline = min(d for _, _, d in tasks)
+        if bound < first_deadline:
+            return True, ""
+        t = last_deadline_before(bound + 1)
+        for _ in range(MAX_ANALYSIS_STEPS):
+            h = demand(t)
+            if h > t:
+                return False, f"processor demand {h} exceeds {t} by time {t}"
+            if h <= first_deadline:
+                return True, ""
+            t = h if h < t else last_deadline_before(t)
+        return None, "processor demand analysis did not finish"
+
     def display_gantt_chart(self, gantt_data):
         """Display enhanced Gantt chart with accurate timings"""
         gantt_chart, time_chart = gantt_data
@@ -265,12 +1483,46 @@ class CPUScheduler:
         for process in self.processes:
             print(f"Process {process.pid}: {process.state}")
         print(f"Average Response Time = {sum(p.response_time for p in self.processes) / len(self.processes)}")
+        print(f"CPU Utilization = {self.cpu_utilization() * 100:.1f}%, Throughput = {self.throughput():.3f} processes/unit")
+        if self.share_accuracy is not None:
+            print(f"Proportional Share Accuracy = {self.share_accuracy * 100:.1f}%")
+        if self.deadline_stats is not None:
+            stats = self.deadline_stats
+            print(f"Deadline Misses = {stats['missed']}/{stats['jobs']} ({stats['miss_ratio'] * 100:.1f}%)")
+            print(f"Tardiness p50/p95/p99/max = {stats['tardiness_p50']}/{stats['tardiness_p95']}/"
+                  f"{stats['tardiness_p99']}/{stats['tardiness_max']}")
+        print("\nMaximum Waiting Time by Priority:")
+        for priority, wait in sorted(self.max_wait_by_priority().items()):
+            print(f"Priority {priority}: {wait}")
+
+    def max_wait_by_priority(self):
+        """Longest waiting time among processes of each priority class"""
+        max_waits = {}
+        for process in self.processes:
+            max_waits[process.priority] = max(max_waits.get(process.priority, 0),
+                                              process.waiting_time)
+        return max_waits
+
+    def makespan(self):
+        """Time at which the last process completed"""
+        return max((p.completion_time for p in self.processes), default=0)
+
+    def cpu_utilization(self):
+        """Fraction of the schedule the CPU spent running processes; time
+        where every process is blocked on I/O or not yet arrived is idle"""
+        span = self.makespan()
+        return sum(p.burst_time * p.jobs for p in self.processes) / span if span else 0
+
+    def throughput(self):
+        """Completed jobs per unit time; one job per process unless periodic"""
+        span = self.makespan()
+        return sum(p.jobs for p in self.processes) / span if span else 0
 
     def calculate_waiting_time(self, process, current_time):
         """Calculate accurate waiting time"""
         if process.state == "ready":
             return current_time - process.arrival_time - \
-                   (process.burst_time - process.remaining_time)
+                   (process.burst_time - process.remaining_time) - process.io_time
         return process.waiting_time
 
     def menu(self):
@@ -284,7 +1536,13 @@ class CPUScheduler:
             print("5. Run Priority (Non-preemptive)")
             print("6. Run Priority (Preemptive)")
             print("7. Display Statistics")
-            print("8. Exit")
+            print("8. Set Priority Aging Interval")
+            print("9. Export Last Schedule as Chrome Trace")
+            print("10. Run Lottery")
+            print("11. Run Stride")
+            print("12. Run EDF")
+            print("13. Run Rate Monotonic")
+            print("14. Exit")
             
             try:
                 choice = int(input("Enter your choice: "))
@@ -295,20 +1553,44 @@ class CPUScheduler:
                     arrival_time = int(input("Enter arrival time: "))
                     burst_time = int(input("Enter burst time: "))
                     priority = int(input("Enter priority (lower number = higher priority): "))
-                    self.add_process(pid, arrival_time, burst_time, priority)
+                    period = input("Enter period for a periodic task (blank = none): ")
+                    deadline = input("Enter relative deadline (blank = period or none): ")
+                    self.add_process(pid, arrival_time, burst_time, priority,
+                                     period=int(period) if period else None,
+                                     deadline=int(deadline) if deadline else None)
                 elif choice == 2:
-                    self.display_gantt_chart(self.round_robin())
+                    self.display_gantt_chart(self.run("rr"))
                 elif choice == 3:
-                    self.display_gantt_chart(self.sjf_nonpreemptive())
+                    self.display_gantt_chart(self.run("sjf"))
                 elif choice == 4:
-                    self.display_gantt_chart(self.sjf_preemptive())
+                    self.display_gantt_chart(self.run("sjf_p"))
                 elif choice == 5:
-                    self.display_gantt_chart(self.priority_scheduling(preemptive=False))
+                    self.display_gantt_chart(self.run("priority"))
                 elif choice == 6:
-                    self.display_gantt_chart(self.priority_scheduling(preemptive=True))
+                    self.display_gantt_chart(self.run("priority_p"))
                 elif choice == 7:
                     self.display_statistics()
                 elif choice == 8:
+                    interval = int(input("Enter aging interval (0 = no aging): "))
+                    if interval < 0:
+                        raise ValueError("Aging interval cannot be negative")
+                    self.aging_interval = interval or None
+                elif choice == 9:
+                    if self.last_run is None:
+                        raise ValueError("Run an algorithm before exporting")
+                    from trace_export import export_chrome_trace
+                    path = input("Enter trace file name [schedule_trace.json]: ") or "schedule_trace.json"
+                    export_chrome_trace(self, self.last_run[3], path)
+                    print(f"Trace written to {path}; open it in ui.perfetto.dev or chrome://tracing")
+                elif choice == 10:
+                    self.display_gantt_chart(self.run("lottery"))
+                elif choice == 11:
+                    self.display_gantt_chart(self.run("stride"))
+                elif choice == 12:
+                    self.display_gantt_chart(self.run("edf"))
+                elif choice == 13:
+                    self.display_gantt_chart(self.run("rm"))
+                elif choice == 14:
                     break
                 else:
                     print("Invalid choice. Please try again.")
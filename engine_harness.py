@@ -0,0 +1,350 @@
+"""Differential correctness and performance harness for scheduling engines.
+
+Frozen reference copies of the tick-based round_robin, sjf_nonpreemptive,
+sjf_preemptive and priority_scheduling algorithms live here as plain
+functions over (pid, arrival, burst, priority) jobs. Every engine in ENGINES
+must reproduce them exactly on randomized and edge-case workloads: the same
+(gantt_chart, time_chart) and the same per-process completion, turnaround,
+waiting and response times. A faster engine is checked by adding it to
+ENGINES.
+
+Engine throughput is measured on a fixed workload and compared with a JSON
+baseline; a run fails when an engine is slower than its baseline by more than
+the tolerance, or has no baseline to compare with. Baselines depend on the
+machine, so record them locally with --update-baselines before comparing.
+
+When hypothesis is installed, property-based workloads are checked too.
+The references cover CPU-only workloads.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+from time import perf_counter
+
+from cpu_scheduler import CPUScheduler
+from monte_carlo import FIELDS, generate_workload
+
+try:
+    from hypothesis import given, settings, strategies
+except ImportError:  # Property-based checks are optional
+    given = None
+
+ALGORITHMS = ("rr", "sjf", "sjf_p", "priority", "priority_p")
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "engine_baselines.json")
+
+
+def reference_round_robin(jobs, time_quantum=3):
+    time = 0
+    remaining = {pid: burst for pid, _, burst, _ in jobs}
+    start = {}
+    finish = {}
+    queue = []
+    gantt_chart, time_chart = [], []
+    while len(finish) < len(jobs):
+        for pid, arrival, _, _ in jobs:
+            if arrival <= time and remaining[pid] > 0 and pid not in queue:
+                queue.append(pid)
+        if not queue:
+            time = min((arrival for _, arrival, _, _ in jobs if arrival > time), default=time + 1)
+            continue
+        pid = queue.pop(0)
+        run = min(time_quantum, remaining[pid])
+        gantt_chart.append(pid)
+        time_chart.append((time, time + run))
+        start.setdefault(pid, time)
+        time += run
+        remaining[pid] -= run
+        if remaining[pid] == 0:
+            finish[pid] = time
+        else:
+            queue.append(pid)
+    return gantt_chart, time_chart, job_metrics(jobs, start, finish)
+
+
+def reference_sjf(jobs, time_quantum=3):
+    time = 0
+    start = {}
+    finish = {}
+    gantt_chart, time_chart = [], []
+    while len(finish) < len(jobs):
+        ready = [job for job in jobs if job[1] <= time and job[0] not in finish]
+        if not ready:
+            time = min((arrival for _, arrival, _, _ in jobs if arrival > time), default=time + 1)
+            continue
+        pid, _, burst, _ = min(ready, key=lambda job: (job[2], job[1], job[0]))
+        gantt_chart.append(pid)
+        time_chart.append((time, time + burst))
+        start[pid] = time
+        time += burst
+        finish[pid] = time
+    return gantt_chart, time_chart, job_metrics(jobs, start, finish)
+
+
+def reference_tick_preemptive(jobs, key):
+    """One tick at a time, run the ready job with the smallest key(job, remaining)"""
+    time = 0
+    remaining = {pid: burst for pid, _, burst, _ in jobs}
+    start = {}
+    finish = {}
+    gantt_chart, time_chart = [], []
+    running = None
+    while len(finish) < len(jobs):
+        ready = [job for job in jobs if job[1] <= time and remaining[job[0]] > 0]
+        if not ready:
+            time = min((arrival for _, arrival, _, _ in jobs if arrival > time), default=time + 1)
+            continue
+        pid = min(ready, key=lambda job: key(job, remaining[job[0]]))[0]
+        if pid != running:
+            if running is not None:
+                time_chart.append((time_chart_start, time))
+            gantt_chart.append(pid)
+            time_chart_start = time
+            running = pid
+        start.setdefault(pid, time)
+        time += 1
+        remaining[pid] -= 1
+        if remaining[pid] == 0:
+            time_chart.append((time_chart_start, time))
+            finish[pid] = time
+            running = None
+    return gantt_chart, time_chart, job_metrics(jobs, start, finish)
+
+
+def reference_sjf_preemptive(jobs, time_quantum=3):
+    return reference_tick_preemptive(jobs, lambda job, remaining: (remaining, job[0]))
+
+
+def reference_priority(jobs, time_quantum=3):
+    time = 0
+    start = {}
+    finish = {}
+    gantt_chart, time_chart = [], []
+    while len(finish) < len(jobs):
+        ready = [job for job in jobs if job[1] <= time and job[0] not in finish]
+        if not ready:
+            time = min((arrival for _, arrival, _, _ in jobs if arrival > time), default=time + 1)
+            continue
+        pid, _, burst, _ = min(ready, key=lambda job: (job[3], job[0]))
+        gantt_chart.append(pid)
+        time_chart.append((time, time + burst))
+        start[pid] = time
+        time += burst
+        finish[pid] = time
+    return gantt_chart, time_chart, job_metrics(jobs, start, finish)
+
+
+def reference_priority_preemptive(jobs, time_quantum=3):
+    return reference_tick_preemptive(jobs, lambda job, remaining: (job[3], job[0]))
+
+
+REFERENCES = {
+    "rr": reference_round_robin,
+    "sjf": reference_sjf,
+    "sjf_p": reference_sjf_preemptive,
+    "priority": reference_priority,
+    "priority_p": reference_priority_preemptive,
+}
+
+
+def job_metrics(jobs, start, finish):
+    """{pid: (completion, turnaround, waiting, response)}"""
+    return {pid: (finish[pid], finish[pid] - arrival, finish[pid] - arrival - burst, start[pid] - arrival)
+            for pid, arrival, burst, _ in jobs}
+
+
+def scheduler_metrics(scheduler):
+    return {p.pid: (p.completion_time, p.turnaround_time, p.waiting_time, p.response_time)
+            for p in scheduler.processes}
+
+
+def new_scheduler(jobs, time_quantum):
+    scheduler = CPUScheduler()
+    scheduler.max_processes = len(jobs)
+    scheduler.time_quantum = time_quantum
+    return scheduler
+
+
+def scheduler_engine(jobs, algorithm, time_quantum=3):
+    """CPUScheduler.run() from scratch"""
+    scheduler = new_scheduler(jobs, time_quantum)
+    scheduler.snapshot_interval = None
+    for job in jobs:
+        scheduler.add_process(*job)
+    gantt_chart, time_chart = scheduler.run(algorithm)
+    return gantt_chart, time_chart, scheduler_metrics(scheduler)
+
+
+def incremental_engine(jobs, algorithm, time_quantum=3):
+    """CPUScheduler.run() resumed from a snapshot after adding the later half
+    of the jobs, as the GUI does when a process is added to a shown schedule"""
+    scheduler = new_scheduler(jobs, time_quantum)
+    scheduler.snapshot_interval = 4
+    split = max(scheduler.min_processes, len(jobs) // 2)
+    for job in jobs[:split]:
+        scheduler.add_process(*job)
+    scheduler.run(algorithm)
+    for job in jobs[split:]:
+        scheduler.add_process(*job)
+    gantt_chart, time_chart = scheduler.run(algorithm)
+    return gantt_chart, time_chart, scheduler_metrics(scheduler)
+
+
+# Engine name -> function(jobs, algorithm, time_quantum) returning
+# (gantt_chart, time_chart, {pid: (completion, turnaround, waiting, response)})
+ENGINES = {
+    "scheduler": scheduler_engine,
+    "incremental": incremental_engine,
+}
+
+
+def random_jobs(seed, min_processes=3, max_processes=12, **options):
+    """Seeded random workload, in the same shape as monte_carlo's"""
+    values = generate_workload(seed, min_processes, max_processes, **options)
+    return [(pid, *values[i:i + FIELDS]) for pid, i in enumerate(range(0, len(values), FIELDS), 1)]
+
+
+def edge_case_workloads():
+    """Named workloads that stress tie-breaking and idle time"""
+    return {
+        "simultaneous_equal": [(pid, 0, 4, 1) for pid in range(1, 6)],
+        "equal_bursts_staggered": [(pid, pid - 1, 3, 2) for pid in range(1, 6)],
+        "idle_gaps": [(1, 0, 2, 1), (2, 10, 3, 0), (3, 10, 1, 2), (4, 30, 5, 1)],
+        "quantum_multiples": [(1, 0, 3, 0), (2, 0, 6, 0), (3, 3, 9, 0), (4, 6, 1, 0)],
+        "unit_bursts": [(pid, pid // 2, 1, pid % 3) for pid in range(1, 9)],
+        "late_short_jobs": [(1, 0, 20, 3), (2, 1, 1, 0), (3, 2, 1, 0), (4, 2, 2, 1)],
+        "reverse_pids": [(1, 0, 5, 2), (2, 0, 4, 2), (3, 0, 4, 1), (4, 1, 4, 1)],
+    }
+
+
+def check_workload(jobs, algorithms, engines, time_quantum=3):
+    """Compare every engine with the reference; returns mismatch descriptions"""
+    failures = []
+    for algorithm in algorithms:
+        expected = REFERENCES[algorithm](jobs, time_quantum)
+        for name in engines:
+            actual = ENGINES[name](jobs, algorithm, time_quantum)
+            for label, want, got in zip(("gantt_chart", "time_chart", "metrics"), expected, actual):
+                if want != got:
+                    failures.append(f"{name}/{algorithm}: {label} differs on {jobs}\n"
+                                    f"  expected {want}\n  got      {got}")
+    return failures
+
+
+def check_properties(algorithms, engines, max_examples=200):
+    """Hypothesis-generated workloads; returns the first failure found, if any"""
+    job = strategies.tuples(strategies.integers(0, 20), strategies.integers(1, 8),
+                            strategies.integers(0, 3))
+
+    @settings(max_examples=max_examples, deadline=None)
+    @given(strategies.lists(job, min_size=3, max_size=10))
+    def property_holds(raw):
+        arrivals = sorted(arrival for arrival, _, _ in raw)
+        arrivals[0] = 0  # The scheduler needs a process at time 0
+        jobs = [(pid, arrival, burst, priority)
+                for pid, (arrival, (_, burst, priority)) in enumerate(zip(arrivals, raw), 1)]
+        failures = check_workload(jobs, algorithms, engines)
+        assert not failures, failures[0]
+
+    try:
+        property_holds()
+    except AssertionError as e:
+        return [str(e)]
+    return []
+
+
+def measure_throughput(engine, jobs, algorithm, repeat=3):
+    """Best of repeat runs, in processes scheduled per second"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = perf_counter()
+        engine(jobs, algorithm)
+        best = min(best, perf_counter() - started)
+    return len(jobs) / best
+
+
+def check_performance(algorithms, engines, baselines, tolerance, processes=300, repeat=5):
+    """Measure throughput; returns ({engine: {algorithm: rate}}, slowdowns,
+    engine/algorithm pairs without a baseline)"""
+    jobs = random_jobs(12345, processes, processes, mean_interarrival=4.0)
+    results = {}
+    slowdowns = []
+    missing = []
+    for name in engines:
+        results[name] = {}
+        for algorithm in algorithms:
+            rate = measure_throughput(ENGINES[name], jobs, algorithm, repeat)
+            results[name][algorithm] = rate
+            baseline = baselines.get(name, {}).get(algorithm)
+            if not baseline:
+                missing.append(f"{name}/{algorithm}")
+            elif rate < baseline * (1 - tolerance):
+                slowdowns.append(f"{name}/{algorithm}: {rate:.0f} processes/s, "
+                                 f"baseline {baseline:.0f} (-{(1 - rate / baseline) * 100:.0f}%)")
+    return results, slowdowns, missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Differential and performance checks for scheduling engines")
+    parser.add_argument("--algorithms", nargs="+", choices=ALGORITHMS, default=list(ALGORITHMS))
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES), default=list(ENGINES))
+    parser.add_argument("--workloads", type=int, default=300, help="Random workloads to compare")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baselines", default=BASELINE_PATH)
+    parser.add_argument("--update-baselines", action="store_true",
+                        help="Store the measured throughput as the new baselines")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed fractional slowdown against the baseline")
+    parser.add_argument("--perf-processes", type=int, default=300)
+    parser.add_argument("--skip-performance", action="store_true")
+    args = parser.parse_args()
+
+    failures = []
+    for name, jobs in edge_case_workloads().items():
+        failures += [f"[{name}] {failure}" for failure in
+                     check_workload(jobs, args.algorithms, args.engines)]
+    rng = random.Random(args.seed)
+    for _ in range(args.workloads):
+        failures += check_workload(random_jobs(rng.getrandbits(32)), args.algorithms, args.engines)
+    if given is not None:
+        failures += check_properties(args.algorithms, args.engines)
+    else:
+        print("hypothesis not installed; skipping property-based workloads")
+    print(f"Differential check: {len(failures)} mismatches")
+    for failure in failures[:10]:
+        print(failure)
+
+    slowdowns = missing = []
+    if not args.skip_performance:
+        baselines = {}
+        if os.path.exists(args.baselines):
+            with open(args.baselines) as f:
+                baselines = json.load(f)
+        results, slowdowns, missing = check_performance(args.algorithms, args.engines, baselines,
+                                               args.tolerance, args.perf_processes)
+        for name, rates in results.items():
+            for algorithm, rate in rates.items():
+                baseline = baselines.get(name, {}).get(algorithm)
+                note = f" (baseline {baseline:.0f})" if baseline else ""
+                print(f"  {name:12} {algorithm:10} {rate:10.0f} processes/s{note}")
+        if args.update_baselines:
+            for name, rates in results.items():
+                baselines.setdefault(name, {}).update(rates)
+            with open(args.baselines, "w") as f:
+                json.dump(baselines, f, indent=2, sort_keys=True)
+            print(f"Baselines written to {args.baselines}")
+            slowdowns = missing = []
+        for slowdown in slowdowns:
+            print(f"Slower than baseline: {slowdown}")
+        if missing:
+            # Without a baseline a slowdown would pass unnoticed
+            print(f"No baseline in {args.baselines} for {', '.join(missing)}; "
+                  "run with --update-baselines to record them")
+
+    if failures or slowdowns or missing:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""Monte Carlo evaluation of scheduling algorithms over random workloads.
+
+Workloads are generated from seeds in the parent process, packed into one
+shared memory block per batch and simulated by a pool of worker processes,
+which only receive the block name and a range of workload indices.
+"""
+import argparse
+import math
+import os
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
+from cpu_scheduler import CPUScheduler
+
+FIELDS = 3  # arrival_time, burst_time, priority per process
+METRICS = ("avg_waiting", "avg_turnaround", "avg_response", "cpu_utilization", "throughput")
+Z_95 = 1.96  # Normal quantile for 95% confidence intervals
+
+
+def generate_workload(seed, min_processes=3, max_processes=10, mean_interarrival=3.0,
+                      max_burst=10, priority_levels=4):
+    """Seeded random workload as a flat list of (arrival, burst, priority) values.
+    Arrivals follow a Poisson process, starting at time 0."""
+    rng = random.Random(seed)
+    values = []
+    time = 0
+    for i in range(rng.randint(min_processes, max_processes)):
+        if i:
+            time += int(rng.expovariate(1 / mean_interarrival))
+        values += (time, rng.randint(1, max_burst), rng.randrange(priority_levels))
+    return values
+
+
+def simulate(values, algorithm):
+    """Run one packed workload and return its metrics in METRICS order"""
+    scheduler = CPUScheduler()
+    scheduler.max_processes = len(values) // FIELDS
+    scheduler.snapshot_interval = None  # Runs are never resumed
+    for pid, i in enumerate(range(0, len(values), FIELDS), 1):
+        scheduler.add_process(pid, *values[i:i + FIELDS])
+    scheduler.run(algorithm)
+    processes = scheduler.processes
+    count = len(processes)
+    return (sum(p.waiting_time for p in processes) / count,
+            sum(p.turnaround_time for p in processes) / count,
+            sum(p.response_time for p in processes) / count,
+            scheduler.cpu_utilization(),
+            scheduler.throughput())
+
+
+def pack_workloads(workloads):
+    """Pack workloads into one int64 array: [count, offsets..., values...]"""
+    packed = array("q", [len(workloads)])
+    offset = 1 + len(workloads) + 1
+    for values in workloads:
+        packed.append(offset)
+        offset += len(values)
+    packed.append(offset)
+    for values in workloads:
+        packed.extend(values)
+    return packed
+
+
+def evaluate_range(block_name, first, last, algorithms):
+    """Worker entry point: simulate workloads first..last-1 of a shared block"""
+    block = shared_memory.SharedMemory(name=block_name)
+    data = block.buf.cast("q")
+    try:
+        results = {algorithm: [] for algorithm in algorithms}
+        for index in range(first, last):
+            values = data[data[1 + index]:data[2 + index]].tolist()
+            for algorithm in algorithms:
+                results[algorithm].append(simulate(values, algorithm))
+        return results
+    finally:
+        data.release()
+        block.close()
+
+
+class RunningStats:
+    """Welford accumulator for a mean and its confidence interval"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def half_width(self):
+        if self.count < 2:
+            return float("inf")
+        return Z_95 * math.sqrt(self.m2 / (self.count - 1) / self.count)
+
+
+class MonteCarloEvaluator:
+    """Evaluate algorithms across thousands of seeded random workloads.
+    Sampling stops once every 95% confidence interval is within
+    relative_precision of its mean, or after max_workloads."""
+
+    def __init__(self, algorithms=tuple(CPUScheduler.ALGORITHMS), seed=0, workers=None,
+                 chunk_size=32, **workload_options):
+        for algorithm in algorithms:
+            if algorithm not in CPUScheduler.ALGORITHMS:
+                raise ValueError(f"Unknown algorithm: {algorithm}")
+        self.algorithms = tuple(algorithms)
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.workload_options = workload_options
+        self.stats = {algorithm: [RunningStats() for _ in METRICS] for algorithm in self.algorithms}
+        self.workloads = 0
+
+    def converged(self, relative_precision):
+        for metric_stats in self.stats.values():
+            for stats in metric_stats:
+                if stats.half_width() > relative_precision * max(abs(stats.mean), 1e-9):
+                    return False
+        return True
+
+    def run(self, max_workloads=10000, min_workloads=200, relative_precision=0.02):
+        """Sample workloads in batches until converged; returns summary()"""
+        # Each batch gives every worker several chunks to balance the load
+        batch_size = self.workers * self.chunk_size * 4
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            while self.workloads < max_workloads:
+                count = min(batch_size, max_workloads - self.workloads)
+                if self.run_batch(pool, count, min_workloads, relative_precision):
+                    break
+        return self.summary()
+
+    def run_batch(self, pool, count, min_workloads, relative_precision):
+        """Simulate count workloads; returns True once converged. Convergence
+        is checked after every chunk, folded in order, so where sampling
+        stops depends on the seed and chunk size but not on the workers."""
+        workloads = [generate_workload(self.seed + self.workloads + i, **self.workload_options)
+                     for i in range(count)]
+        packed = pack_workloads(workloads)
+        block = shared_memory.SharedMemory(create=True, size=len(packed) * packed.itemsize)
+        try:
+            block.buf[:len(packed) * packed.itemsize] = packed.tobytes()
+            futures = [pool.submit(evaluate_range, block.name, first,
+                                   min(first + self.chunk_size, count), self.algorithms)
+                       for first in range(0, count, self.chunk_size)]
+            for future in futures:
+                results = future.result()
+                for algorithm, rows in results.items():
+                    for row in rows:
+                        for stats, value in zip(self.stats[algorithm], row):
+                            stats.add(value)
+                self.workloads += len(rows)
+                if self.workloads >= min_workloads and self.converged(relative_precision):
+                    for pending in futures:
+                        pending.cancel()
+                    # Chunks already running still read the block
+                    wait(futures)
+                    return True
+        finally:
+            block.close()
+            block.unlink()
+        return False
+
+    def summary(self):
+        """{algorithm: {metric: (mean, 95% half width)}} plus the sample count"""
+        result = {algorithm: {metric: (stats.mean, stats.half_width())
+                              for metric, stats in zip(METRICS, metric_stats)}
+                  for algorithm, metric_stats in self.stats.items()}
+        result["workloads"] = self.workloads
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo evaluation of CPU scheduling algorithms")
+    parser.add_argument("--algorithms", nargs="+", default=list(CPUScheduler.ALGORITHMS))
+    parser.add_argument("--max-workloads", type=int, default=10000)
+    parser.add_argument("--min-workloads", type=int, default=200)
+    parser.add_argument("--precision", type=float, default=0.02,
+                        help="Target 95%% CI half width relative to the mean")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    evaluator = MonteCarloEvaluator(args.algorithms, seed=args.seed, workers=args.workers)
+    summary = evaluator.run(args.max_workloads, args.min_workloads, args.precision)
+    print(f"Workloads evaluated: {summary.pop('workloads')}")
+    for algorithm, metrics in summary.items():
+        print(f"\n{algorithm}:")
+        for metric, (mean, half_width) in metrics.items():
+            print(f"  {metric:16} {mean:10.3f} ± {half_width:.3f}")
+
+
+if __name__ == "__main__":
+    main()
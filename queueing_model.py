@@ -0,0 +1,240 @@
+"""Analytic fast estimates of scheduler metrics from queueing models.
+
+A workload is summarized by its arrival rate and the first two moments of
+its CPU bursts, fitted from a bounded random sample of processes, so an
+estimate costs the same for ten processes or ten million. Each algorithm maps
+onto a closed-form single-server model:
+
+- rr, lottery, stride: M/G/1 processor sharing
+- priority, priority_p: Cobham's non-preemptive / preemptive-resume priority
+  M/G/1, with one class per priority level
+- sjf, sjf_p: the same priority models with one class per burst length
+  (for sjf_p this bounds SRTF, which also favours partly-run jobs)
+- fcfs: plain M/G/1 (Pollaczek-Khinchine), as a reference point
+
+Models assume Poisson arrivals and ignore I/O, aging and deadlines, so
+validate() reports how far an estimate is from a sampled simulation.
+"""
+import argparse
+import math
+import random
+
+from cpu_scheduler import CPUScheduler
+
+METRICS = ("avg_waiting", "avg_turnaround", "avg_response", "cpu_utilization", "throughput")
+PERCENTILES = (0.50, 0.95, 0.99)
+MODELS = {
+    "fcfs": "fcfs",
+    "rr": "processor_sharing",
+    "lottery": "processor_sharing",
+    "stride": "processor_sharing",
+    "priority": "priority",
+    "priority_p": "priority",
+    "sjf": "priority",
+    "sjf_p": "priority",
+}
+PREEMPTIVE = ("priority_p", "sjf_p")
+
+
+class WorkloadFit:
+    """Arrival rate and burst moments of a workload, overall and per class"""
+
+    def __init__(self, arrival_rate, sample):
+        self.arrival_rate = arrival_rate
+        self.mean_service = sum(burst for _, burst, _ in sample) / len(sample)
+        self.second_moment = sum(burst * burst for _, burst, _ in sample) / len(sample)
+        self.utilization = arrival_rate * self.mean_service
+        self.by_priority = self.classes(sample, lambda job: job[2])
+        self.by_size = self.classes(sample, lambda job: job[1])
+
+    def classes(self, sample, key):
+        """{class: (arrival rate, E[S], E[S^2])}, classes in scheduling order"""
+        groups = {}
+        for job in sample:
+            groups.setdefault(key(job), []).append(job[1])
+        return {k: (self.arrival_rate * len(bursts) / len(sample),
+                    sum(bursts) / len(bursts),
+                    sum(b * b for b in bursts) / len(bursts))
+                for k, bursts in sorted(groups.items())}
+
+
+def fit_workload(processes, sample_size=10000, seed=0):
+    """Fit a WorkloadFit from at most sample_size randomly chosen processes"""
+    if len(processes) < 2:
+        raise ValueError("Need at least 2 processes to fit an arrival rate")
+    if len(processes) > sample_size:
+        chosen = random.Random(seed).sample(processes, sample_size)
+    else:
+        chosen = processes
+    arrivals = [p.arrival_time for p in chosen]
+    span = max(arrivals) - min(arrivals)
+    if span <= 0:
+        raise ValueError("All sampled processes arrive at once; no arrival rate to fit")
+    if len(chosen) < len(processes):
+        # A random sample of k spans (k - 1) / (k + 1) of the full arrival span on average
+        span *= (len(chosen) + 1) / (len(chosen) - 1)
+    arrival_rate = (len(processes) - 1) / span
+    return WorkloadFit(arrival_rate, [(p.arrival_time, p.burst_time, p.priority) for p in chosen])
+
+
+def exceedance_percentile(components, fraction):
+    """Time t with P(wait > t) = 1 - fraction for a mixture of waits that are
+    0 with probability 1 - p and otherwise exponential with mean m / p.
+    components is a list of (weight, p, m)."""
+    def tail(t):
+        return sum(w * p * math.exp(-t * p / m) for w, p, m in components if m > 0)
+
+    if tail(0) <= 1 - fraction:
+        return 0.0
+    low, high = 0.0, 1.0
+    while tail(high) > 1 - fraction:
+        high *= 2
+    for _ in range(60):
+        middle = (low + high) / 2
+        if tail(middle) > 1 - fraction:
+            low = middle
+        else:
+            high = middle
+    return high
+
+
+def estimate(fit, algorithm, time_quantum=3):
+    """Predicted metrics for algorithm on a fitted workload: the METRICS
+    means plus waiting and response percentiles. Raises ValueError when the
+    offered load is 1 or more, since no steady state exists."""
+    if algorithm not in MODELS:
+        raise ValueError(f"No queueing model for algorithm: {algorithm}")
+    rho = fit.utilization
+    if rho >= 1:
+        raise ValueError(f"Offered load {rho:.3f} >= 1; queue grows without bound")
+
+    model = MODELS[algorithm]
+    if model == "fcfs":
+        wait = fit.arrival_rate * fit.second_moment / (2 * (1 - rho))
+        # (weight, P(wait > 0), mean wait, mean response)
+        classes = [(1.0, rho, wait, wait)]
+    elif model == "processor_sharing":
+        wait = rho * fit.mean_service / (1 - rho)
+        # A new job first waits for about E[N] = rho / (1 - rho) quanta
+        quantum = min(time_quantum, fit.mean_service)
+        classes = [(1.0, rho, wait, rho / (1 - rho) * quantum)]
+    else:
+        groups = fit.by_priority if algorithm.startswith("priority") else fit.by_size
+        classes = priority_classes(fit, groups, algorithm in PREEMPTIVE)
+
+    avg_wait = sum(w * m for w, _, m, _ in classes)
+    result = {
+        "avg_waiting": avg_wait,
+        "avg_turnaround": avg_wait + fit.mean_service,
+        "avg_response": sum(w * r for w, _, _, r in classes),
+        "cpu_utilization": rho,
+        "throughput": fit.arrival_rate,
+    }
+    for fraction in PERCENTILES:
+        label = f"p{round(fraction * 100)}"
+        result[f"{label}_waiting"] = exceedance_percentile([(w, p, m) for w, p, m, _ in classes], fraction)
+        result[f"{label}_response"] = exceedance_percentile([(w, p, r) for w, p, _, r in classes], fraction)
+    return result
+
+
+def priority_classes(fit, groups, preemptive):
+    """Cobham's M/G/1 priority formulas, highest priority class first.
+    Returns (weight, P(wait > 0), mean wait, mean response) per class."""
+    classes = []
+    higher = 0.0  # Load of strictly higher classes
+    residual = 0.0  # Mean residual work seen by an arrival, from classes counted so far
+    if not preemptive:
+        residual = sum(rate * m2 for rate, _, m2 in groups.values()) / 2
+    for rate, m1, m2 in groups.values():
+        load = higher + rate * m1
+        if preemptive:
+            residual += rate * m2 / 2
+            delay = residual / ((1 - higher) * (1 - load))
+            wait = m1 / (1 - higher) + delay - m1
+            classes.append((rate / fit.arrival_rate, load, wait, delay))
+        else:
+            wait = residual / ((1 - higher) * (1 - load))
+            classes.append((rate / fit.arrival_rate, fit.utilization, wait, wait))
+        higher = load
+    return classes
+
+
+def simulate_sample(processes, algorithm, sample_size=2000, time_quantum=3):
+    """Simulate the first sample_size processes by arrival, rebased to time 0,
+    and return their METRICS"""
+    window = sorted(processes, key=lambda p: (p.arrival_time, p.pid))[:sample_size]
+    scheduler = CPUScheduler()
+    scheduler.max_processes = len(window)
+    scheduler.snapshot_interval = None
+    scheduler.time_quantum = time_quantum
+    base = window[0].arrival_time
+    for pid, p in enumerate(window, 1):
+        scheduler.add_process(pid, p.arrival_time - base, p.burst_time, p.priority)
+    scheduler.run(algorithm)
+    count = len(window)
+    return {
+        "avg_waiting": sum(p.waiting_time for p in scheduler.processes) / count,
+        "avg_turnaround": sum(p.turnaround_time for p in scheduler.processes) / count,
+        "avg_response": sum(p.response_time for p in scheduler.processes) / count,
+        "cpu_utilization": scheduler.cpu_utilization(),
+        "throughput": scheduler.throughput(),
+    }
+
+
+def validate(processes, algorithm, sample_size=2000, time_quantum=3, seed=0):
+    """Compare the analytic estimate with a simulation of a sample of the
+    workload. Returns {metric: (estimate, simulated, relative error)}."""
+    predicted = estimate(fit_workload(processes, seed=seed), algorithm, time_quantum)
+    simulated = simulate_sample(processes, algorithm, sample_size, time_quantum)
+    return {metric: (predicted[metric], simulated[metric],
+                     abs(predicted[metric] - simulated[metric]) / max(abs(simulated[metric]), 1e-9))
+            for metric in METRICS}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analytic estimate of scheduler metrics")
+    parser.add_argument("--algorithms", nargs="+", default=list(MODELS))
+    parser.add_argument("--trace", default=None, help="Fit a trace or CSV job log (see trace_import)")
+    parser.add_argument("--processes", type=int, default=10000,
+                        help="Size of the synthetic Poisson workload when no trace is given")
+    parser.add_argument("--mean-interarrival", type=float, default=8.0)
+    parser.add_argument("--max-burst", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--validate", type=int, default=0, metavar="N",
+                        help="Also simulate the first N processes and report relative errors")
+    args = parser.parse_args()
+
+    scheduler = CPUScheduler()
+    if args.trace:
+        import trace_import
+        with trace_import.open_trace(args.trace) as f:
+            trace_format = "csv" if args.trace.removesuffix(".gz").endswith(".csv") else "sched"
+            trace_import.load_trace(scheduler, trace_import.read_trace(f, trace_format))
+    else:
+        from monte_carlo import FIELDS, generate_workload
+        values = generate_workload(args.seed, args.processes, args.processes,
+                                   args.mean_interarrival, args.max_burst)
+        scheduler.max_processes = args.processes
+        for pid, i in enumerate(range(0, len(values), FIELDS), 1):
+            scheduler.add_process(pid, *values[i:i + FIELDS])
+
+    fit = fit_workload(scheduler.processes, seed=args.seed)
+    print(f"Arrival rate = {fit.arrival_rate:.4f}, E[S] = {fit.mean_service:.3f}, "
+          f"E[S^2] = {fit.second_moment:.3f}, load = {fit.utilization:.3f}")
+    for algorithm in args.algorithms:
+        print(f"\n{algorithm}:")
+        try:
+            result = estimate(fit, algorithm, scheduler.time_quantum)
+        except ValueError as e:
+            print(f"  {e}")
+            continue
+        for metric, value in result.items():
+            print(f"  {metric:16} {value:10.3f}")
+        if args.validate and algorithm != "fcfs":
+            for metric, (predicted, simulated, error) in validate(
+                    scheduler.processes, algorithm, args.validate, scheduler.time_quantum, args.seed).items():
+                print(f"  {metric:16} simulated {simulated:10.3f}, error {error * 100:5.1f}%")
+
+
+if __name__ == "__main__":
+    main()
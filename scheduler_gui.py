@@ -1,16 +1,112 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from cpu_scheduler import CPUScheduler, Process
+from cpu_scheduler import CPUScheduler, Process, SimulationCancelled
 from threading import Thread
 import time
 import json
 import os
 
+class VirtualProcessTable:
+    """Process table that only materializes its visible rows. A fixed set of
+    Treeview rows is refilled from a sorted, filtered index of the scheduler's
+    processes, so the cost per frame does not grow with the process count."""
+    
+    COLUMNS = ["PID", "Arrival", "Burst", "Priority", "Waiting", "Turnaround", "State"]
+    
+    def __init__(self, parent, scheduler, height=5):
+        self.scheduler = scheduler
+        self.height = height
+        self.offset = 0
+        self.sort_column = None
+        self.sort_reverse = False
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace_add("write", lambda *args: self.rebuild())
+        self.view = []  # Indices into scheduler.processes, sorted and filtered
+        self.view_source = None  # (process list, count) the view was built from
+        
+        self.frame = ttk.Frame(parent)
+        ttk.Label(self.frame, text="Filter:").grid(row=0, column=0, sticky=tk.W)
+        ttk.Entry(self.frame, textvariable=self.filter_var, width=20).grid(row=0, column=1, sticky=tk.W)
+        
+        self.tree = ttk.Treeview(self.frame, columns=self.COLUMNS, show="headings", height=height)
+        for column in self.COLUMNS:
+            self.tree.heading(column, text=column, command=lambda c=column: self.sort_by(c))
+            self.tree.column(column, width=80)
+        self.rows = [self.tree.insert("", "end", values=()) for _ in range(height)]
+        self.tree.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E))
+        
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.on_scroll)
+        self.scrollbar.grid(row=1, column=2, sticky=(tk.N, tk.S))
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll_to(self.offset - e.delta // 120))
+        self.tree.bind("<Button-4>", lambda e: self.scroll_to(self.offset - 1))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_to(self.offset + 1))
+    
+    def grid(self, **kwargs):
+        self.frame.grid(**kwargs)
+    
+    @staticmethod
+    def row_values(p):
+        return (f"P{p.pid}", p.arrival_time, p.burst_time, p.priority,
+                p.waiting_time, p.turnaround_time, p.state.title())
+    
+    def sort_by(self, column):
+        """Sort by a column; clicking the same column again reverses the order"""
+        if self.sort_column == column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column = column
+            self.sort_reverse = False
+        self.rebuild()
+    
+    def rebuild(self):
+        """Recompute the sorted, filtered index (only on sort/filter/process changes)"""
+        processes = self.scheduler.processes
+        self.view_source = (processes, len(processes))
+        text = self.filter_var.get().strip().lower()
+        view = range(len(processes))
+        if text:
+            view = [i for i in view
+                    if any(text in str(v).lower() for v in self.row_values(processes[i]))]
+        view = list(view)
+        if self.sort_column is not None:
+            column = self.COLUMNS.index(self.sort_column)
+            key = (lambda i: processes[i].pid) if column == 0 else \
+                  (lambda i: self.row_values(processes[i])[column])
+            view.sort(key=key, reverse=self.sort_reverse)
+        self.view = view
+        self.scroll_to(self.offset)
+    
+    def on_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self.view)))
+        elif unit == "pages":
+            self.scroll_to(self.offset + int(amount) * self.height)
+        else:
+            self.scroll_to(self.offset + int(amount))
+    
+    def scroll_to(self, offset):
+        self.offset = max(0, min(offset, len(self.view) - self.height))
+        self.render()
+    
+    def render(self):
+        """Refill the visible rows with current process values"""
+        processes = self.scheduler.processes
+        if self.view_source != (processes, len(processes)):
+            self.rebuild()
+            return
+        for i, row in enumerate(self.rows):
+            index = self.offset + i
+            values = self.row_values(processes[self.view[index]]) if index < len(self.view) else ()
+            self.tree.item(row, values=values)
+        total = max(len(self.view), 1)
+        self.scrollbar.set(self.offset / total, min(self.offset + self.height, total) / total)
+
 class SchedulerGUI:
     def __init__(self, root):
         self.root = root
         self.root.title("CPU Scheduler Visualizer")
         self.scheduler = CPUScheduler()
+        self.scheduler.enable_state_log()  # Feeds CPU utilization metrics
         
         # Initialize StringVar variables
         self.cpu_util_var = tk.StringVar(value="CPU: 0%")
@@ -19,7 +115,10 @@ class SchedulerGUI:
         self.arrival_var = tk.StringVar()
         self.burst_var = tk.StringVar()
         self.priority_var = tk.StringVar()
+        self.period_var = tk.StringVar()
+        self.deadline_var = tk.StringVar()
         self.algo_var = tk.StringVar(value="rr")
+        self.aging_var = tk.StringVar(value="0")
         
         # Initialize other variables
         self.animation_speed = 1.0
@@ -32,6 +131,14 @@ class SchedulerGUI:
         self.last_process_state = None
         self.gantt_history = []  # Track Gantt chart history
         self.current_process = None  # Currently running process
+        self.current_gantt_data = None  # Schedule being shown
+        self.computing = False  # Schedule being computed by the worker thread
+        self.cancel_requested = False
+        self.compute_progress = 0
+        self.compute_result = None
+        self.compute_done = None  # Tk-thread handler for the worker's schedule
+        self.editing_buttons = []  # Disabled while the worker owns the processes
+        self.progress_var = tk.DoubleVar(value=0)
         
         # Setup GUI components
         self.setup_gui()
@@ -59,7 +166,16 @@ class SchedulerGUI:
         self.priority_var = tk.StringVar()
         ttk.Entry(control_frame, textvariable=self.priority_var, width=10).grid(row=0, column=5)
         
-        ttk.Button(control_frame, text="Add Process", command=self.add_process).grid(row=0, column=6, padx=5)
+        # Optional real-time parameters, left blank for ordinary processes
+        ttk.Label(control_frame, text="Period:").grid(row=0, column=6)
+        ttk.Entry(control_frame, textvariable=self.period_var, width=6).grid(row=0, column=7)
+        
+        ttk.Label(control_frame, text="Deadline:").grid(row=0, column=8)
+        ttk.Entry(control_frame, textvariable=self.deadline_var, width=6).grid(row=0, column=9)
+        
+        add_button = ttk.Button(control_frame, text="Add Process", command=self.add_process)
+        add_button.grid(row=0, column=10, padx=5)
+        self.editing_buttons.append(add_button)
         
         # Algorithm selection
         algo_frame = ttk.LabelFrame(main_frame, text="Algorithm Selection", padding="5")
@@ -71,15 +187,28 @@ class SchedulerGUI:
             ("SJF (Non-preemptive)", "sjf"),
             ("SJF (Preemptive)", "sjf_p"),
             ("Priority (Non-preemptive)", "priority"),
-            ("Priority (Preemptive)", "priority_p")
+            ("Priority (Preemptive)", "priority_p"),
+            ("Lottery", "lottery"),
+            ("Stride", "stride"),
+            ("EDF", "edf"),
+            ("Rate Monotonic", "rm")
         ]
         
         for i, (text, value) in enumerate(algorithms):
             ttk.Radiobutton(algo_frame, text=text, value=value, 
                           variable=self.algo_var).grid(row=0, column=i, padx=5)
         
+        ttk.Label(algo_frame, text="Aging Interval (0 = off):").grid(row=1, column=3)
+        ttk.Entry(algo_frame, textvariable=self.aging_var, width=6).grid(row=1, column=4, sticky=tk.W)
+        
         ttk.Button(algo_frame, text="Start Simulation", 
-                  command=self.start_simulation).grid(row=1, column=0, columnspan=5, pady=5)
+                  command=self.start_simulation).grid(row=1, column=0, columnspan=3, pady=5)
+        
+        # Schedule computation progress
+        ttk.Progressbar(algo_frame, variable=self.progress_var, maximum=100,
+                        length=200).grid(row=2, column=0, columnspan=3, sticky=(tk.W, tk.E))
+        ttk.Button(algo_frame, text="Cancel", 
+                  command=self.cancel_simulation).grid(row=2, column=3, padx=5)
         
         # Process visualization
         vis_frame = ttk.LabelFrame(main_frame, text="Process Visualization", padding="5")
@@ -95,6 +224,9 @@ class SchedulerGUI:
         self.stats_text = tk.Text(self.stats_frame, height=5, width=70)
         self.stats_text.grid(row=0, column=0, sticky=(tk.W, tk.E))
         
+        self.process_table = VirtualProcessTable(self.stats_frame, self.scheduler)
+        self.process_table.grid(row=1, column=0, sticky=(tk.W, tk.E))
+        
         # Add timeline control panel
         timeline_frame = ttk.LabelFrame(main_frame, text="Timeline Control", padding="5")
         timeline_frame.grid(row=4, column=0, sticky=(tk.W, tk.E), pady=5)
@@ -120,9 +252,12 @@ class SchedulerGUI:
         ttk.Button(control_panel, text="Start", command=self.start_simulation).grid(row=0, column=0, padx=5)
         ttk.Button(control_panel, text="Pause/Resume", command=self.toggle_pause).grid(row=0, column=1, padx=5)
         ttk.Button(control_panel, text="Step", command=self.step_simulation).grid(row=0, column=2, padx=5)
-        ttk.Button(control_panel, text="Reset", command=self.reset_simulation).grid(row=0, column=3, padx=5)
+        reset_button = ttk.Button(control_panel, text="Reset", command=self.reset_simulation)
+        reset_button.grid(row=0, column=3, padx=5)
         ttk.Button(control_panel, text="Save", command=self.save_config).grid(row=0, column=4, padx=5)
-        ttk.Button(control_panel, text="Load", command=self.load_config).grid(row=0, column=5, padx=5)
+        load_button = ttk.Button(control_panel, text="Load", command=self.load_config)
+        load_button.grid(row=0, column=5, padx=5)
+        self.editing_buttons += [reset_button, load_button]
         ttk.Button(control_panel, text="Help", command=self.show_help).grid(row=0, column=6, padx=5)
         
         # Metrics panel
@@ -147,7 +282,12 @@ CPU Scheduler Simulator Help
 Algorithms:
 - Round Robin (Q=3): Time slice based scheduling
 - SJF: Shortest Job First (Preemptive/Non-preemptive)
-- Priority: Priority based scheduling
+- Priority: Priority based scheduling; an aging interval raises a
+  waiting process one priority level per interval waited
+- Lottery/Stride: Proportional share by tickets, taken from a saved
+  "weight" or derived from priority (lower number = more tickets)
+- EDF/Rate Monotonic: Real-time scheduling of jobs with deadlines;
+  task sets that fail the schedulability test are rejected
 
 Controls:
 - Add Process: Enter process details
@@ -155,11 +295,18 @@ Controls:
 - Pause: Pause simulation
 - Step: Execute one time unit
 - Save/Load: Save or load process configurations
+- Cancel: Stop computing a schedule or stop the animation
+- Table: Click a column header to sort, type in Filter to search
 
 Process Parameters:
 - Arrival Time: When process enters system
 - Burst Time: CPU time needed
 - Priority: Lower number = Higher priority
+- Period: Optional; releases a new job of Burst Time every period
+- Deadline: Optional; time after each release the job is due
+  (defaults to the period)
+- I/O bursts: Saved configurations may give "bursts" as alternating
+  CPU and I/O times (e.g. [4, 2, 3]) and an optional "io_device"
 
 Statistics:
 - CPU Utilization: Percentage of CPU in use
@@ -170,12 +317,15 @@ Statistics:
         
     def reset_simulation(self):
         """Reset simulation state"""
+        if self.computing:
+            return
         self.is_running = False
         self.paused = False
         self.step_mode = False
         self.current_time = 0
         self.context_switches = 0
         self.cpu_utilization = 0
+        self.scheduler.state_log.clear()
         
         # Reset processes
         for p in self.scheduler.processes:
@@ -190,19 +340,30 @@ Statistics:
         self.update_statistics()
         
     def add_process(self):
+        if self.computing:
+            return
         try:
             arrival = int(self.arrival_var.get())
             burst = int(self.burst_var.get())
             priority = int(self.priority_var.get())
+            period = int(self.period_var.get()) if self.period_var.get() else None
+            deadline = int(self.deadline_var.get()) if self.deadline_var.get() else None
             pid = len(self.scheduler.processes) + 1
             
-            self.scheduler.add_process(pid, arrival, burst, priority)
+            self.scheduler.add_process(pid, arrival, burst, priority, period=period, deadline=deadline)
             self.draw_process_list()
             
             # Clear inputs
             self.arrival_var.set("")
             self.burst_var.set("")
             self.priority_var.set("")
+            self.period_var.set("")
+            self.deadline_var.set("")
+            
+            # What-if editing: only the schedule after the new arrival is
+            # recomputed, on the worker thread like any other run
+            if self.current_gantt_data is not None and not self.is_running:
+                self.start_computation(self.algo_var.get(), self.show_recomputed)
             
         except ValueError as e:
             messagebox.showerror("Error", str(e))
@@ -211,12 +372,14 @@ Statistics:
         """Draw process list with state indicators"""
         self.canvas.delete("process_list")
         y = 20
-        for p in self.scheduler.processes:
+        visible_rows = max(int(self.canvas.cget("height")) // 30, 1)
+        for p in self.scheduler.processes[:visible_rows]:
             # Process ID
             self.canvas.create_text(20, y, text=f"P{p.pid}", tags="process_list")
             
             # State indicator
-            state_colors = {"ready": "yellow", "running": "green", "completed": "gray"}
+            state_colors = {"ready": "yellow", "running": "green",
+                            "blocked": "orange", "completed": "gray"}
             self.canvas.create_rectangle(40, y-10, 60, y+10,
                                       fill=state_colors[p.state],
                                       outline="black",
@@ -242,6 +405,8 @@ Statistics:
     def draw_gantt_chart(self):
         """Enhanced Gantt chart with accurate timings"""
         self.state_canvas.delete("gantt")
+        if self.current_gantt_data is None:
+            return
         x = 50
         y = 6  # Moved up from 60
         cell_width = 40
@@ -249,14 +414,20 @@ Statistics:
         
         # Get timing data
         gantt_chart, time_chart = self.current_gantt_data
-        max_time = time_chart[-1][1]
+        if not time_chart:
+            return
+        # Only the part of the chart that fits on the canvas is drawn
+        visible_time = int(self.state_canvas.cget("width")) // cell_width
+        visible_rows = int(self.state_canvas.cget("height")) // cell_height + 1
+        max_time = min(time_chart[-1][1], visible_time)
+        by_pid = {p.pid: p for p in self.scheduler.processes}
         
         # Draw timeline grid
         for i in range(max_time + 1):
             grid_x = x + (i * cell_width)
             self.state_canvas.create_line(
                 grid_x, y,
-                grid_x, y + len(self.scheduler.processes)*cell_height,
+                grid_x, y + min(len(self.scheduler.processes), visible_rows)*cell_height,
                 fill="gray", dash=(2,2), tags="gantt"
             )
             self.state_canvas.create_text(
@@ -267,7 +438,11 @@ Statistics:
         # Draw process executions
         colors = ["#FFB6C1", "#98FB98", "#87CEFA", "#DDA0DD", "#F0E68C"]
         for i, (pid, (start, end)) in enumerate(zip(gantt_chart, time_chart)):
-            process = next(p for p in self.scheduler.processes if p.pid == pid)
+            if start > max_time:
+                break
+            process = by_pid[pid]
+            if process.pid > visible_rows:
+                continue
             color = colors[process.pid % len(colors)]
             
             # Draw execution block
@@ -321,32 +496,7 @@ Statistics:
     
     def update_process_table(self):
         """Update process information in tabulated format"""
-        # Clear any existing table
-        for widget in self.stats_frame.winfo_children():
-            if isinstance(widget, ttk.Treeview):
-                widget.destroy()
-                
-        headers = ["PID", "Arrival", "Burst", "Priority", "Waiting", "Turnaround", "State"]
-        table = ttk.Treeview(self.stats_frame, columns=headers, show="headings", height=5)
-        
-        # Configure headers
-        for header in headers:
-            table.heading(header, text=header)
-            table.column(header, width=80)
-        
-        # Add process data
-        for p in self.scheduler.processes:
-            table.insert("", "end", values=(
-                f"P{p.pid}",
-                p.arrival_time,
-                p.burst_time,
-                p.priority,
-                p.waiting_time,
-                p.turnaround_time,
-                p.state.title()
-            ))
-        
-        table.grid(row=1, column=0, sticky=(tk.W, tk.E))
+        self.process_table.render()
     
     def animate_execution(self, gantt_data):
         """Animated execution with timing data"""
@@ -354,6 +504,12 @@ Statistics:
         self.current_time = 0
         self.current_gantt_data = gantt_data
         gantt_chart, time_chart = gantt_data
+
+        # The run has already finished every process and logged its
+        # transitions; the animation only replays them for display
+        for p in self.scheduler.processes:
+            p.state = "ready"
+            p.remaining_time = p.burst_time * p.jobs
         
         def update_animation():
             last_pid = None
@@ -390,8 +546,7 @@ Statistics:
     def update_performance_metrics(self):
         """Calculate and update performance metrics"""
         # CPU Utilization
-        active_time = sum(1 for p in self.scheduler.processes if p.state == "running")
-        self.cpu_utilization = (active_time / self.current_time) * 100 if self.current_time > 0 else 0
+        self.cpu_utilization = self.measure_cpu_utilization()
         
         # Throughput
         completed = sum(1 for p in self.scheduler.processes if p.state == "completed")
@@ -428,12 +583,22 @@ Statistics:
         try:
             processes = []
             for p in self.scheduler.processes:
-                processes.append({
+                config = {
                     'pid': p.pid,
                     'arrival_time': p.arrival_time,
                     'burst_time': p.burst_time,
                     'priority': p.priority
-                })
+                }
+                if len(p.bursts) > 1:  # Only I/O-bound processes need these
+                    config['bursts'] = p.bursts
+                    config['io_device'] = p.io_device
+                if p.weight:
+                    config['weight'] = p.weight
+                if p.period:
+                    config['period'] = p.period
+                if p.deadline:
+                    config['deadline'] = p.deadline
+                processes.append(config)
             
             filename = 'process_config.json'
             with open(filename, 'w') as f:
@@ -444,6 +609,8 @@ Statistics:
     
     def load_config(self):
         """Load process configuration from file"""
+        if self.computing:
+            return
         try:
             filename = 'process_config.json'
             if not os.path.exists(filename):
@@ -462,7 +629,12 @@ Statistics:
                     p['pid'],
                     p['arrival_time'],
                     p['burst_time'],
-                    p['priority']
+                    p['priority'],
+                    p.get('bursts'),
+                    p.get('io_device'),
+                    p.get('weight'),
+                    p.get('deadline'),
+                    p.get('period')
                 )
             
             self.draw_process_list()
@@ -482,9 +654,7 @@ Statistics:
                                          fill="white", outline="black")
         
         # Calculate real CPU utilization
-        running_processes = sum(1 for p in self.scheduler.processes if p.state == "running")
-        total_time = self.current_time if self.current_time > 0 else 1
-        self.cpu_utilization = (running_processes / total_time) * 100
+        self.cpu_utilization = self.measure_cpu_utilization()
         
         # CPU usage bar
         used_width = int((meter_width * self.cpu_utilization) / 100)
@@ -505,22 +675,21 @@ Statistics:
                 # Transition to running
                 if p.state != "running":
                     self.animate_transition(p, "ready", "running")
-                    p.update_state("running", current_time)
+                    p.state = "running"
                     if self.last_process_state != pid:
                         self.context_switches += 1
                 
                 p.remaining_time -= 1
                 if p.remaining_time == 0:
                     self.animate_transition(p, "running", "completed")
-                    p.update_state("completed", current_time)
+                    p.state = "completed"
                 
                 self.last_process_state = pid
                 self.current_process = p
             
-            elif p.state != "completed":
-                if p.state == "running":
-                    self.animate_transition(p, "running", "ready")
-                p.update_state("ready", current_time)
+            elif p.state == "running":
+                self.animate_transition(p, "running", "ready")
+                p.state = "ready"
 
     def animate_transition(self, process, from_state, to_state):
         """Animate process state transitions"""
@@ -544,15 +713,25 @@ Statistics:
         
         self.root.after(500, lambda: self.canvas.delete("transition"))
 
+    def measure_cpu_utilization(self):
+        """Percentage of elapsed ticks with a running process, from the state
+        log written by the scheduling run, or from the time chart once the
+        log has wrapped past the current time"""
+        elapsed = self.current_time + 1  # Include the tick being animated
+        try:
+            busy = self.scheduler.state_log.busy_time(0, elapsed)
+        except ValueError:
+            _, time_chart = self.current_gantt_data
+            busy = sum(min(end, elapsed) - start for start, end in time_chart if start < elapsed)
+        return (busy / elapsed) * 100
+
     def calculate_metrics(self):
         """Enhanced performance metrics calculation"""
         if self.current_time == 0:
             return
             
         # CPU Utilization (weighted by time spent)
-        total_run_time = sum(len([t for t, s in p.state_history if s == "running"]) 
-                            for p in self.scheduler.processes)
-        self.cpu_utilization = (total_run_time / self.current_time) * 100
+        self.cpu_utilization = self.measure_cpu_utilization()
         
         # Throughput (completed processes per unit time)
         completed = sum(1 for p in self.scheduler.processes if p.state == "completed")
@@ -574,7 +753,7 @@ Statistics:
                 f"Need minimum {self.scheduler.min_processes} processes to run simulation")
             return
             
-        if self.is_running:
+        if self.is_running or self.computing:
             return
             
         # Reset process states
@@ -582,24 +761,83 @@ Statistics:
             p.state = "ready"
             p.remaining_time = p.burst_time
         
-        # Run selected algorithm
+        # Run selected algorithm on a worker thread so the window stays responsive
         algo = self.algo_var.get()
         try:
-            if (algo == "rr"):
-                gantt_data = self.scheduler.round_robin()
-            elif (algo == "sjf"):
-                gantt_data = self.scheduler.sjf_nonpreemptive()
-            elif (algo == "sjf_p"):
-                gantt_data = self.scheduler.sjf_preemptive()
-            elif (algo == "priority"):
-                gantt_data = self.scheduler.priority_scheduling(False)
-            else:
-                gantt_data = self.scheduler.priority_scheduling(True)
-                
-            self.animate_execution(gantt_data)
-            self.update_statistics()
-        except Exception as e:
+            aging = int(self.aging_var.get() or 0)
+            if aging < 0:
+                raise ValueError("Aging interval cannot be negative")
+            self.scheduler.aging_interval = aging or None
+        except ValueError as e:
             messagebox.showerror("Error", f"Simulation error: {str(e)}")
+            return
+        
+        self.start_computation(algo, self.show_simulation)
+    
+    def start_computation(self, algo, on_done):
+        """Run algo on a worker thread, then pass the schedule to on_done on
+        the Tk thread. Editing is disabled until then, since the worker
+        mutates the scheduler's processes."""
+        self.computing = True
+        self.cancel_requested = False
+        self.compute_progress = 0
+        self.compute_result = None
+        self.compute_done = on_done
+        for button in self.editing_buttons:
+            button.state(["disabled"])
+        self.scheduler.progress_callback = self.report_progress
+        Thread(target=self.compute_schedule, args=(algo,), daemon=True).start()
+        self.root.after(100, self.poll_computation)
+    
+    def show_simulation(self, gantt_data):
+        self.animate_execution(gantt_data)
+        self.update_statistics()
+    
+    def show_recomputed(self, gantt_data):
+        self.current_gantt_data = gantt_data
+        self.draw_gantt_chart()
+        self.update_statistics()
+    
+    def compute_schedule(self, algo):
+        """Worker thread: compute the schedule without touching Tk"""
+        try:
+            self.compute_result = ("done", self.scheduler.run(algo))
+        except SimulationCancelled:
+            self.compute_result = ("cancelled", None)
+        except Exception as e:
+            self.compute_result = ("error", e)
+    
+    def report_progress(self, completed, total):
+        """Progress callback from the worker; also where cancellation happens"""
+        self.compute_progress = completed * 100 / total
+        if self.cancel_requested:
+            raise SimulationCancelled()
+    
+    def poll_computation(self):
+        """Tk thread: show worker progress and pick up its result"""
+        self.progress_var.set(self.compute_progress)
+        if self.compute_result is None:
+            self.root.after(100, self.poll_computation)
+            return
+        
+        status, value = self.compute_result
+        self.computing = False
+        self.scheduler.progress_callback = None
+        for button in self.editing_buttons:
+            button.state(["!disabled"])
+        if status == "done":
+            self.progress_var.set(100)
+            self.compute_done(value)
+        elif status == "error":
+            self.progress_var.set(0)
+            messagebox.showerror("Error", f"Simulation error: {str(value)}")
+        else:
+            self.progress_var.set(0)
+    
+    def cancel_simulation(self):
+        """Cancel schedule computation or stop a running animation"""
+        self.cancel_requested = True
+        self.is_running = False
     
     def update_statistics(self):
         self.stats_text.delete(1.0, tk.END)
@@ -607,15 +845,27 @@ Statistics:
         total_wait = 0
         total_turnaround = 0
         
+        # Per-process lines only for small workloads; the table covers the rest
+        if len(self.scheduler.processes) <= 20:
+            for p in self.scheduler.processes:
+                stats += f"Process {p.pid}: Wait={p.waiting_time}, Turnaround={p.turnaround_time}\n"
         for p in self.scheduler.processes:
-            stats += f"Process {p.pid}: Wait={p.waiting_time}, Turnaround={p.turnaround_time}\n"
             total_wait += p.waiting_time
             total_turnaround += p.turnaround_time
             
         avg_wait = total_wait / len(self.scheduler.processes)
         avg_turnaround = total_turnaround / len(self.scheduler.processes)
         stats += f"\nAverage Wait Time: {avg_wait:.2f}\n"
-        stats += f"Average Turnaround Time: {avg_turnaround:.2f}"
+        stats += f"Average Turnaround Time: {avg_turnaround:.2f}\n"
+        stats += "Max Wait by Priority: " + ", ".join(
+            f"P{priority}={wait}" for priority, wait in sorted(self.scheduler.max_wait_by_priority().items()))
+        if self.scheduler.share_accuracy is not None:
+            stats += f"\nShare Accuracy: {self.scheduler.share_accuracy * 100:.1f}%"
+        if self.scheduler.deadline_stats is not None:
+            deadlines = self.scheduler.deadline_stats
+            stats += (f"\nDeadline Misses: {deadlines['missed']}/{deadlines['jobs']} "
+                      f"({deadlines['miss_ratio'] * 100:.1f}%), Tardiness p95="
+                      f"{deadlines['tardiness_p95']}, max={deadlines['tardiness_max']}")
         
         self.stats_text.insert(1.0, stats)
 
@@ -0,0 +1,103 @@
+"""Streaming export of schedules to the Chrome Trace Event JSON format.
+
+The output opens in chrome://tracing, ui.perfetto.dev and other viewers that
+read Trace Event JSON. Events are written one at a time while walking the
+schedule, so memory use does not grow with the number of slices.
+"""
+import json
+
+TRACE_PID = 1  # All tracks live under one trace "process"
+CPU_TID = 0  # Track holding every execution slice
+
+
+class ChromeTraceWriter:
+    """Writes trace events incrementally into a {"traceEvents": [...]} file"""
+
+    def __init__(self, f, time_scale=1000):
+        self.f = f
+        self.time_scale = time_scale  # Microseconds per scheduler time unit
+        self.first = True
+        f.write('{"displayTimeUnit":"ms","traceEvents":[\n')
+
+    def event(self, **fields):
+        fields.setdefault("pid", TRACE_PID)
+        if "ts" in fields:
+            fields["ts"] *= self.time_scale
+        if "dur" in fields:
+            fields["dur"] *= self.time_scale
+        if not self.first:
+            self.f.write(",\n")
+        self.first = False
+        self.f.write(json.dumps(fields, separators=(",", ":")))
+
+    def name_track(self, tid, name):
+        self.event(ph="M", name="thread_name", tid=tid, args={"name": name})
+
+    def slice(self, tid, name, start, end, **args):
+        self.event(ph="X", name=name, tid=tid, ts=start, dur=end - start, args=args)
+
+    def instant(self, tid, name, time, **args):
+        self.event(ph="i", s="t", name=name, tid=tid, ts=time, args=args)
+
+    def close(self):
+        self.f.write("\n]}\n")
+
+
+def export_chrome_trace(scheduler, gantt_data, path, time_scale=1000):
+    """Write a scheduler's last schedule to path as Chrome Trace Event JSON.
+    Slices go on a CPU track and on one track per process, together with
+    arrival, first run, preemption, I/O block, job and process completion
+    events."""
+    gantt_chart, time_chart = gantt_data
+    by_pid = {p.pid: p for p in scheduler.processes}
+    executed = {}  # pid -> CPU time run so far, to tell preemption from I/O
+
+    with open(path, "w") as f:
+        writer = ChromeTraceWriter(f, time_scale)
+        writer.event(ph="M", name="process_name", args={"name": "CPU Scheduler"})
+        writer.name_track(CPU_TID, "CPU")
+        for p in scheduler.processes:
+            writer.name_track(p.pid, f"P{p.pid}")
+            writer.instant(p.pid, "arrival", p.arrival_time, priority=p.priority,
+                           burst_time=p.burst_time)
+
+        for index, (pid, (start, end)) in enumerate(zip(gantt_chart, time_chart)):
+            process = by_pid[pid]
+            writer.slice(CPU_TID, f"P{pid}", start, end, pid=pid)
+            writer.slice(pid, "running", start, end)
+            if pid not in executed:
+                executed[pid] = 0
+                writer.instant(pid, "first run", start, response_time=start - process.arrival_time)
+            before = executed[pid]
+            executed[pid] += end - start
+
+            # A periodic process finishes a job every burst_time of CPU; slices
+            # of back-to-back jobs are merged, so a job can end inside one
+            first_job = before // process.burst_time + 1
+            for job in range(first_job, min(executed[pid] // process.burst_time, process.jobs - 1) + 1):
+                writer.instant(pid, "job completion", start + job * process.burst_time - before, job=job)
+
+            if executed[pid] == process.burst_time * process.jobs:
+                writer.instant(pid, "completion", end, turnaround_time=process.turnaround_time,
+                               waiting_time=process.waiting_time)
+            elif executed[pid] % process.burst_time == 0:
+                pass  # Waiting for its next job's release
+            elif executed[pid] in cpu_burst_ends(process):
+                writer.instant(pid, "blocked", end)
+            elif (index + 1 < len(gantt_chart) and gantt_chart[index + 1] == pid and
+                  time_chart[index + 1][0] == end):
+                pass  # Quantum expired with nothing else ready; it runs on
+            else:
+                writer.instant(pid, "preemption", end,
+                               remaining_time=process.burst_time - executed[pid] % process.burst_time)
+        writer.close()
+
+
+def cpu_burst_ends(process):
+    """Cumulative CPU time at the end of each CPU burst before an I/O burst"""
+    ends = []
+    total = 0
+    for burst in process.bursts[0:-1:2]:
+        total += burst
+        ends.append(total)
+    return ends
@@ -0,0 +1,234 @@
+"""Import workloads from real scheduler traces.
+
+Two local file formats are supported:
+
+- ftrace / ``perf sched script`` text dumps containing ``sched_switch`` and
+  ``sched_wakeup`` events, in either the key=value form written by ftrace or
+  the compact ``comm:pid [prio] state ==> comm:pid [prio]`` form of perf
+- CSV job logs with one job per row (pid, arrival, burst and optional priority)
+
+Parsing is a chain of generators over the file's lines, so a multi-GB trace is
+read with memory bounded by the number of tasks alive at once, not by its size.
+Each stage yields (pid, arrival, burst, priority) job records that
+load_trace() adds to a CPUScheduler.
+"""
+import argparse
+import csv
+import gzip
+import re
+
+from cpu_scheduler import CPUScheduler
+
+# A job ends when its task leaves the CPU in any state but runnable
+RUNNABLE_STATES = ("R", "R+")
+KERNEL_NORMAL_PRIO = 100  # Kernel prio 100..139 covers nice -20..19
+
+EVENT_RE = re.compile(r"\s(\d+\.\d+):\s+(?:sched:)?(sched_switch|sched_wakeup_new|sched_wakeup):\s*(.*)$")
+FIELD_RE = re.compile(r"(\w+)=(\S+)")
+PERF_TASK_RE = re.compile(r"\S+:(\d+) \[(\d+)\](?: (\S+))?")
+
+# CSV column names accepted for each field, first match wins
+CSV_ALIASES = {
+    "pid": ("pid", "job_id", "id", "task"),
+    "arrival": ("arrival_time", "arrival", "submit_time", "submit", "start_time", "start"),
+    "burst": ("burst_time", "burst", "runtime", "run_time", "duration", "cpu_time"),
+    "priority": ("priority", "prio", "nice"),
+}
+
+
+def open_trace(path):
+    """Open a trace for streaming text reads; .gz files are decompressed on the fly"""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    return open(path, encoding="utf-8", errors="replace", newline="")
+
+
+def parse_sched_events(lines):
+    """Yield (timestamp, event, fields) for each sched_switch or sched_wakeup
+    line. Switch fields are prev_pid, prev_prio, prev_state, next_pid and
+    next_prio; wakeup fields are pid and prio. Other lines are skipped."""
+    for line in lines:
+        match = EVENT_RE.search(line)
+        if not match:
+            continue
+        timestamp, event, payload = match.groups()
+        fields = dict(FIELD_RE.findall(payload))
+        if not fields:
+            # perf's compact form: "comm:pid [prio] state ==> comm:pid [prio]"
+            tasks = PERF_TASK_RE.findall(payload)
+            if event == "sched_switch" and len(tasks) == 2:
+                fields = {"prev_pid": tasks[0][0], "prev_prio": tasks[0][1], "prev_state": tasks[0][2],
+                          "next_pid": tasks[1][0], "next_prio": tasks[1][1]}
+            elif event != "sched_switch" and tasks:
+                fields = {"pid": tasks[0][0], "prio": tasks[0][1]}
+            else:
+                continue
+        yield float(timestamp), event, fields
+
+
+def window(events, start=None, end=None):
+    """Keep events with start <= timestamp < end. Traces are in time order,
+    so reading stops at the first event past end."""
+    for event in events:
+        if start is not None and event[0] < start:
+            continue
+        if end is not None and event[0] >= end:
+            return
+        yield event
+
+
+def sched_jobs(events, time_unit=1e-3):
+    """Turn scheduler events into (pid, arrival, burst, priority) job records.
+    A job arrives when its task wakes up (or first runs, if the wakeup is not
+    in the trace), accumulates CPU time across preemptions, and ends when the
+    task sleeps or exits. Times are converted to integer ticks of time_unit
+    seconds. Records are yielded as jobs finish, not in arrival order."""
+    jobs = {}  # pid -> [arrival, cpu_time, priority, on_cpu_since]
+    timestamp = 0.0
+    for timestamp, event, fields in events:
+        if event != "sched_switch":
+            pid = int(fields["pid"])
+            if pid and pid not in jobs:
+                jobs[pid] = [timestamp, 0.0, int(fields.get("prio", KERNEL_NORMAL_PRIO)), None]
+            continue
+
+        prev_pid, next_pid = int(fields["prev_pid"]), int(fields["next_pid"])
+        job = jobs.get(prev_pid)
+        if prev_pid and job is not None and job[3] is not None:
+            job[1] += timestamp - job[3]
+            job[3] = None
+            if fields.get("prev_state") not in RUNNABLE_STATES:
+                del jobs[prev_pid]
+                yield job_record(prev_pid, job, time_unit)
+        if next_pid:
+            job = jobs.setdefault(next_pid, [timestamp, 0.0, int(fields["next_prio"]), None])
+            job[3] = timestamp
+
+    # Jobs still running or runnable when the trace ends
+    for pid, job in jobs.items():
+        if job[3] is not None:
+            job[1] += timestamp - job[3]
+        if job[1] > 0:
+            yield job_record(pid, job, time_unit)
+
+
+def job_record(pid, job, time_unit):
+    arrival, cpu_time, prio, _ = job
+    return (pid, round(arrival / time_unit), max(1, round(cpu_time / time_unit)),
+            max(0, prio - KERNEL_NORMAL_PRIO))
+
+
+def source_pid(value):
+    """A job's source PID: an int for numeric ids, otherwise the id string
+    itself, so names like "job-a" never collide with numeric PIDs"""
+    try:
+        return int(value)
+    except ValueError:
+        return value.strip()
+
+
+def parse_job_csv(lines, time_unit=1):
+    """Yield (pid, arrival, burst, priority) from a CSV job log with a header
+    row. Column names are matched against CSV_ALIASES; times are divided by
+    time_unit and rounded to integer ticks. Non-integer ids such as "job-a"
+    are kept as strings, see source_pid. Rows with a missing or non-positive
+    burst, or a malformed time or priority, are skipped."""
+    reader = csv.DictReader(lines)
+    header = {name.strip().lower(): name for name in reader.fieldnames or ()}
+    columns = {}
+    for field, aliases in CSV_ALIASES.items():
+        columns[field] = next((header[alias] for alias in aliases if alias in header), None)
+    for field in ("arrival", "burst"):
+        if columns[field] is None:
+            raise ValueError(f"CSV job log has no {field} column (expected one of {CSV_ALIASES[field]})")
+
+    for number, row in enumerate(reader, 1):
+        try:
+            arrival = round(float(row[columns["arrival"]]) / time_unit)
+            burst = round(float(row[columns["burst"]]) / time_unit)
+            priority = row[columns["priority"]] if columns["priority"] else None
+            priority = max(0, int(float(priority))) if priority else 0
+        except (TypeError, ValueError, OverflowError):
+            continue
+        if burst <= 0:
+            continue
+        pid = row[columns["pid"]] if columns["pid"] else None
+        yield source_pid(pid) if pid else number, arrival, burst, priority
+
+
+def only_pids(records, pids):
+    """Keep job records of the given source PIDs"""
+    pids = set(pids)
+    for record in records:
+        if record[0] in pids:
+            yield record
+
+
+def read_trace(lines, trace_format="sched", start=None, end=None, pids=None, time_unit=None):
+    """Build the lazy pipeline for one trace: lines -> events -> job records.
+    start and end bound the time window in the trace's own units (seconds for
+    sched traces, ticks for CSV); pids keeps only those source PIDs."""
+    if trace_format == "csv":
+        records = parse_job_csv(lines, time_unit or 1)
+        if start is not None or end is not None:
+            records = (r for r in records
+                       if (start is None or r[1] >= start) and (end is None or r[1] < end))
+    elif trace_format == "sched":
+        records = sched_jobs(window(parse_sched_events(lines), start, end), time_unit or 1e-3)
+    else:
+        raise ValueError(f"Unknown trace format: {trace_format}")
+    if pids:
+        records = only_pids(records, pids)
+    return records
+
+
+def load_trace(scheduler, records, limit=None):
+    """Add job records to scheduler as processes, sorted by arrival and rebased
+    so the first arrives at time 0. PIDs are renumbered 1..n in arrival order.
+    Returns the source PID of each new process, indexed by new pid - 1."""
+    jobs = []
+    for record in records:
+        jobs.append(record)
+        if limit is not None and len(jobs) >= limit:
+            break
+    if not jobs:
+        raise ValueError("Trace contains no jobs")
+    # Numeric and string source PIDs only meet on equal arrivals; ints go first
+    jobs.sort(key=lambda job: (job[1], isinstance(job[0], str), job[0]))
+    base = jobs[0][1]
+    scheduler.max_processes = max(scheduler.max_processes, len(scheduler.processes) + len(jobs))
+    for pid, (_, arrival, burst, priority) in enumerate(jobs, len(scheduler.processes) + 1):
+        scheduler.add_process(pid, arrival - base, burst, priority)
+    return [job[0] for job in jobs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a scheduler trace or CSV job log")
+    parser.add_argument("path", help="sched_switch text dump or CSV job log, optionally .gz")
+    parser.add_argument("--format", choices=("sched", "csv"), default=None,
+                        help="Defaults to csv for .csv files, sched otherwise")
+    parser.add_argument("--start", type=float, default=None)
+    parser.add_argument("--end", type=float, default=None)
+    parser.add_argument("--pid", type=source_pid, action="append", dest="pids")
+    parser.add_argument("--time-unit", type=float, default=None,
+                        help="Seconds per tick for sched traces (default 0.001), "
+                             "or CSV units per tick (default 1)")
+    parser.add_argument("--limit", type=int, default=None, help="Load at most this many jobs")
+    parser.add_argument("--algorithm", choices=list(CPUScheduler.ALGORITHMS), default="rr")
+    args = parser.parse_args()
+
+    trace_format = args.format or ("csv" if args.path.removesuffix(".gz").endswith(".csv") else "sched")
+    scheduler = CPUScheduler()
+    with open_trace(args.path) as f:
+        records = read_trace(f, trace_format, args.start, args.end, args.pids, args.time_unit)
+        load_trace(scheduler, records, args.limit)
+    scheduler.run(args.algorithm)
+    count = len(scheduler.processes)
+    print(f"Jobs loaded: {count}")
+    print(f"Average Waiting Time = {sum(p.waiting_time for p in scheduler.processes) / count:.2f}")
+    print(f"Average Turnaround Time = {sum(p.turnaround_time for p in scheduler.processes) / count:.2f}")
+    print(f"CPU Utilization = {scheduler.cpu_utilization() * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()